@@ -1,10 +1,6 @@
 """Base agent that plays Cambio with simple heuristics but never calls Cambio."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from game import Player
+from game import Player, PEEK_OWN, PEEK_OPPONENT, SWAP, BLACK_KING
 
 
 class BaseAgent(Player):
@@ -17,13 +13,15 @@ class BaseAgent(Player):
     - Never call Cambio
     """
 
+    __slots__ = ('discard_threshold',)
+
     def __init__(self, name="BaseAgent", discard_threshold=4):
         super().__init__(name)
         self.discard_threshold = discard_threshold
 
     def choose_draw(self, game):
         """Draw from discard if top card value < discard_threshold, otherwise draw from deck."""
-        if game.discard and game.discard[-1].get_value() < self.discard_threshold:
+        if game.discard and game.discard[-1].value < self.discard_threshold:
             return 'discard'
         return 'deck'
 
@@ -32,7 +30,7 @@ class BaseAgent(Player):
 
         This ensures we keep min(max(known hand), drawn_card).
         """
-        drawn_value = drawn_card.get_value()
+        drawn_value = drawn_card.value
 
         # Find max value card among known positions
         max_pos = None
@@ -40,7 +38,7 @@ class BaseAgent(Player):
 
         for pos, card in self.known.items():
             if pos < len(self.hand):
-                card_value = card.get_value()
+                card_value = card.value
                 if card_value > max_value:
                     max_value = card_value
                     max_pos = pos
@@ -60,20 +58,20 @@ class BaseAgent(Player):
 
         Returns dict with action details or None to skip.
         """
-        if card.rank in ['7', '8']:
+        if card.power_kind == PEEK_OWN:
             # Peek at own unknown card
             unknown_pos = self._find_unknown_position()
             if unknown_pos is not None:
                 return {'type': 'peek_own', 'position': unknown_pos}
 
-        elif card.rank in ['9', '10']:
+        elif card.power_kind == PEEK_OPPONENT:
             # Peek at random opponent's card
             if opponents:
                 opp = opponents[0]
                 if opp.hand:
                     return {'type': 'peek_opponent', 'opponent': opp, 'position': 0}
 
-        elif card.rank in ['J', 'Q']:
+        elif card.power_kind == SWAP:
             # Blind swap: trade our worst known card for opponent's random card
             worst_pos = self._find_worst_known_position()
             if worst_pos is not None and opponents and opponents[0].hand:
@@ -84,7 +82,7 @@ class BaseAgent(Player):
                     'opp_position': 0
                 }
 
-        elif card.rank == 'K' and card.suit in ['Spades', 'Clubs']:
+        elif card.power_kind == BLACK_KING:
             # Black King: see then swap
             worst_pos = self._find_worst_known_position()
             if worst_pos is not None and opponents and opponents[0].hand:
@@ -111,7 +109,7 @@ class BaseAgent(Player):
 
         for pos, card in self.known.items():
             if pos < len(self.hand):
-                val = card.get_value()
+                val = card.value
                 if val > worst_value:
                     worst_value = val
                     worst_pos = pos
@@ -1,17 +1,19 @@
 """Bayesian agent that tracks all 54 cards and computes expected values dynamically."""
 
-import random
-import sys
-from pathlib import Path
+from game import Player, PEEK_OWN, PEEK_OPPONENT, SWAP, BLACK_KING
+from agents.card_tracker import CardTracker, tuple_value
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from game import Player
-from agents.card_tracker import CardTracker, card_to_tuple, tuple_value
+# Power types where the acting player trades one of their cards with another player
+_SWAP_POWER_TYPES = frozenset(['blind_swap', 'king_swap'])
 
 
 class BayesianAgent(Player):
     """Agent that maintains a full card tracker for EV-based decisions."""
 
+    __slots__ = ('tracker', 'cambio_threshold', 'cambio_margin', 'cambio_knowledge_gap',
+                 'ev_dominance_margin', '_initialized', '_last_discard_len',
+                 '_prev_discard_top', 'opponent_known')
+
     def __init__(self, name="BayesianAgent", discard_threshold=None, cambio_threshold=10,
                  cambio_margin=4, cambio_knowledge_gap=1, ev_dominance_margin=8):
         super().__init__(name)
@@ -25,6 +27,21 @@ class BayesianAgent(Player):
         self._prev_discard_top = None  # Track discard top before each turn
         self.opponent_known = {}  # Bug fix A: {opp_player_index: {pos: Card}}
 
+    def reset(self):
+        """Forget everything tracked during the last game."""
+        super().reset()
+        self.tracker.reset()
+        self._initialized = False
+        self._last_discard_len = 0
+        self._prev_discard_top = None
+        self.opponent_known = {}
+
+    def set_full_known(self, hand):
+        """Take *hand* as our hand with every position known, and record it in the tracker."""
+        self.hand = hand
+        self.known = dict(enumerate(hand))
+        self.tracker.set_own_cards(hand)
+
     def _ensure_initialized(self, game):
         """Lazy-initialize tracker on first interaction with the game."""
         if self._initialized:
@@ -35,7 +52,7 @@ class BayesianAgent(Player):
         self.tracker.sync_discard(game.discard)
         self._last_discard_len = len(game.discard)
         if game.discard:
-            self._prev_discard_top = card_to_tuple(game.discard[-1])
+            self._prev_discard_top = game.discard[-1].key
         self._initialized = True
 
     def observe_turn(self, turn_data, game):
@@ -50,7 +67,7 @@ class BayesianAgent(Player):
         self._last_discard_len = len(game.discard)
         # Update prev_discard_top for next turn
         if game.discard:
-            self._prev_discard_top = card_to_tuple(game.discard[-1])
+            self._prev_discard_top = game.discard[-1].key
         else:
             self._prev_discard_top = None
 
@@ -71,8 +88,7 @@ class BayesianAgent(Player):
             if opp_id < len(game.players):
                 opp_name = game.players[opp_id].name
                 if opp_name != self.name:
-                    for pos, card in positions.items():
-                        self.tracker.set_opponent_card(opp_name, pos, card_to_tuple(card))
+                    self.tracker.set_opponent_cards(opp_name, positions)
 
         # --- Process actions by OTHER players ---
         if acting_player != self.name:
@@ -84,7 +100,7 @@ class BayesianAgent(Player):
             target_pos = turn_data.get('power_target_position')
 
             # Opponent blind/king swapped US — clear our targeted position
-            if power_type in ('blind_swap', 'king_swap'):
+            if power_type in _SWAP_POWER_TYPES:
                 if target_player == self.name and target_pos is not None:
                     self.tracker.own_card_swapped_out(target_pos)
                     if target_pos in self.known:
@@ -106,7 +122,7 @@ class BayesianAgent(Player):
                 self.tracker.clear_opponent_position(acting_player, swap_position)
 
             # Opponent drew from discard + used power (swap): we know what they got
-            if draw_source == 'discard' and power_type in ('blind_swap', 'king_swap'):
+            if draw_source == 'discard' and power_type in _SWAP_POWER_TYPES:
                 # They drew from discard but the power card itself got discarded,
                 # not the discard card — the discard card they drew was used to decide power usage.
                 # Actually, in the game engine, power cards are drawn then discarded after use.
@@ -119,15 +135,14 @@ class BayesianAgent(Player):
         if acting_player == self.name:
             power_type = turn_data.get('power_type')
             swap_position = turn_data.get('swap_position')
-            if power_type in ('blind_swap', 'king_swap') and swap_position is not None:
+            if power_type in _SWAP_POWER_TYPES and swap_position is not None:
                 # After swapping, our position has the opponent's old card (unknown)
                 self.tracker.own_card_swapped_out(swap_position)
                 if swap_position in self.known:
                     del self.known[swap_position]
 
         # Sync own known cards with tracker
-        for pos, card in self.known.items():
-            self.tracker.set_own_card(pos, card_to_tuple(card))
+        self.tracker.set_own_cards(self.known)
 
     def observe_stick(self, stick_data, game):
         """Update tracker after a stick attempt."""
@@ -150,12 +165,13 @@ class BayesianAgent(Player):
         if not game.discard:
             return 'deck'
 
-        discard_value = game.discard[-1].get_value()
+        discard_value = game.discard[-1].value
 
         # Find the position that would benefit most from the discard card
+        e_unknown = self.tracker.expected_value_of_unknown()
         best_improvement = 0
         for pos in self.tracker.own_hand:
-            current_ev = self.tracker.expected_value_at_position(pos)
+            current_ev = self.tracker.expected_value_at_position(pos, e_unknown)
             improvement = current_ev - discard_value
             if improvement > best_improvement:
                 best_improvement = improvement
@@ -172,15 +188,16 @@ class BayesianAgent(Player):
 
     def choose_action(self, drawn_card):
         """Swap into the position with biggest EV improvement, with info bonus for unknowns."""
-        drawn_value = drawn_card.get_value()
+        drawn_value = drawn_card.value
 
         best_pos = None
         best_score = 0  # Must be positive to swap
+        e_unknown = self.tracker.expected_value_of_unknown()
 
         for pos in self.tracker.own_hand:
             if pos >= len(self.hand):
                 continue
-            current_ev = self.tracker.expected_value_at_position(pos)
+            current_ev = self.tracker.expected_value_at_position(pos, e_unknown)
             improvement = current_ev - drawn_value
 
             # Info bonus: placing a known-low card into an unknown slot
@@ -204,39 +221,40 @@ class BayesianAgent(Player):
         """Use power cards strategically based on information gain and EV."""
         self._ensure_initialized(game)
 
-        if card.rank in ['7', '8']:
+        if card.power_kind == PEEK_OWN:
             # Peek own: target first unknown position
             unknowns = [p for p in self.tracker.own_unknown_positions() if p < len(self.hand)]
             if unknowns:
                 return {'type': 'peek_own', 'position': unknowns[0]}
 
-        elif card.rank in ['9', '10']:
+        elif card.power_kind == PEEK_OPPONENT:
             # Peek opponent: prefer opponents likely winning (lower expected score)
             if opponents:
                 best_opp = None
                 best_score = float('inf')
                 best_pos = None
+                e_unknown = self.tracker.expected_value_of_unknown()
                 for opp in opponents:
                     unknown_pos = self.tracker.opponent_unknown_positions(opp.name)
                     if not unknown_pos:
                         continue
-                    opp_score = self.tracker.expected_opponent_score(opp.name)
+                    opp_score = self.tracker.expected_opponent_score(opp.name, e_unknown)
                     if opp_score < best_score:
                         best_score = opp_score
                         best_opp = opp
-                        best_pos = random.choice(unknown_pos)
+                        best_pos = self.rng.choice(unknown_pos)
                 # Fallback: if all positions are known for low-score opps, pick any with unknowns
                 if best_opp is None:
                     for opp in opponents:
                         unknown_pos = self.tracker.opponent_unknown_positions(opp.name)
                         if unknown_pos:
                             best_opp = opp
-                            best_pos = random.choice(unknown_pos)
+                            best_pos = self.rng.choice(unknown_pos)
                             break
                 if best_opp and best_pos is not None:
                     return {'type': 'peek_opponent', 'opponent': best_opp, 'position': best_pos}
 
-        elif card.rank in ['J', 'Q']:
+        elif card.power_kind == SWAP:
             # Blind swap: swap our worst card for opponent's best known (or random unknown)
             worst = self.tracker.worst_own_position()
             if worst is not None and opponents:
@@ -256,9 +274,9 @@ class BayesianAgent(Player):
                             'opp_position': opp_pos,
                         }
                     # Fallback: random opponent, random position
-                    opp = random.choice(opponents)
+                    opp = self.rng.choice(opponents)
                     if opp.hand:
-                        opp_pos = random.randint(0, len(opp.hand) - 1)
+                        opp_pos = self.rng.randint(0, len(opp.hand) - 1)
                         return {
                             'type': 'blind_swap',
                             'my_position': worst_pos,
@@ -266,7 +284,7 @@ class BayesianAgent(Player):
                             'opp_position': opp_pos,
                         }
 
-        elif card.rank == 'K' and card.suit in ['Spades', 'Clubs']:
+        elif card.power_kind == BLACK_KING:
             # Black King: more aggressive threshold since we peek before swapping
             worst = self.tracker.worst_own_position()
             if worst is not None and opponents:
@@ -284,7 +302,7 @@ class BayesianAgent(Player):
                         if len(unknown_pos) > most_unknowns:
                             most_unknowns = len(unknown_pos)
                             best_opp = opp
-                            target_pos = random.choice(unknown_pos) if unknown_pos else None
+                            target_pos = self.rng.choice(unknown_pos) if unknown_pos else None
 
                     if best_opp and target_pos is not None:
                         return {
@@ -304,12 +322,15 @@ class BayesianAgent(Player):
         best_opp = None
         best_pos = None
         best_val = float('inf')
+        opponent_hands = self.tracker.opponent_hands
 
         for opp in opponents:
-            if opp.name not in self.tracker.opponent_hands:
+            positions = opponent_hands.get(opp.name)
+            if positions is None:
                 continue
-            for pos, card in self.tracker.opponent_hands[opp.name].items():
-                if card is not None and pos < len(opp.hand):
+            hand_size = len(opp.hand)
+            for pos, card in positions.items():
+                if card is not None and pos < hand_size:
                     val = tuple_value(card[0], card[1])
                     if val < best_val:
                         best_val = val
@@ -324,19 +345,19 @@ class BayesianAgent(Player):
                        player2=None, pos2=None, peek_player=None, peek_pos=None,
                        verbose=True):
         """Override for Black King: peek first, only swap if beneficial."""
-        if card.rank == 'K' and card.suit in ['Spades', 'Clubs']:
+        if card.power_kind == BLACK_KING:
             if opponent and my_pos is not None and opp_pos is not None:
                 # Peek at opponent's card
                 peeked = opponent.hand[opp_pos]
-                peeked_value = peeked.get_value()
+                peeked_value = peeked.value
                 if verbose:
                     print(f"  {self.name} used Black {card} to see {opponent.name}'s position {opp_pos}: {peeked}")
 
                 # Record in tracker regardless of swap decision
-                self.tracker.set_opponent_card(opponent.name, opp_pos, card_to_tuple(peeked))
+                self.tracker.set_opponent_card(opponent.name, opp_pos, peeked)
 
                 # Get our card's value at my_pos
-                my_card_value = self.hand[my_pos].get_value()
+                my_card_value = self.hand[my_pos].value
 
                 # Only swap if opponent's card is better (lower value) than ours
                 if peeked_value < my_card_value:
@@ -363,7 +384,12 @@ class BayesianAgent(Player):
         """
         known_count = self.tracker.own_known_count()
         hand_size = len(self.hand)
-        my_expected = self.tracker.expected_own_score()
+        e_unknown = self.tracker.expected_value_of_unknown()
+        my_expected = self.tracker.expected_own_score(e_unknown)
+        opp_expected_scores = [
+            self.tracker.expected_opponent_score(name, e_unknown)
+            for name in self.tracker.opponent_hand_sizes
+        ]
 
         # Compute opponent info used by both paths
         total_opp_known = 0
@@ -390,12 +416,8 @@ class BayesianAgent(Player):
                 adaptive_threshold = 5
 
             # Check margin against all opponents
-            has_margin = True
-            for name in self.tracker.opponent_hand_sizes:
-                opp_expected = self.tracker.expected_opponent_score(name)
-                if my_expected >= opp_expected - adaptive_margin:
-                    has_margin = False
-                    break
+            has_margin = all(my_expected < opp_expected - adaptive_margin
+                             for opp_expected in opp_expected_scores)
 
             if has_margin and my_expected < adaptive_threshold:
                 return True
@@ -405,17 +427,8 @@ class BayesianAgent(Player):
                 return True
 
         # --- Path (b): EV dominance — ahead of everyone by a large margin ---
-        ev_dominant = True
-        for name in self.tracker.opponent_hand_sizes:
-            opp_expected = self.tracker.expected_opponent_score(name)
-            if my_expected >= opp_expected - self.ev_dominance_margin:
-                ev_dominant = False
-                break
-
-        if ev_dominant:
-            return True
-
-        return False
+        return all(my_expected < opp_expected - self.ev_dominance_margin
+                   for opp_expected in opp_expected_scores)
 
     def choose_stick(self, game):
         """Return positions of known cards matching the discard top rank."""
@@ -423,8 +436,5 @@ class BayesianAgent(Player):
             return []
 
         top_rank = game.discard[-1].rank
-        positions = []
-        for pos, card in self.tracker.own_hand.items():
-            if card is not None and card[0] == top_rank:
-                positions.append(pos)
-        return positions
+        return [pos for pos, card in self.tracker.own_hand.items()
+                if card is not None and card[0] == top_rank]
@@ -7,13 +7,11 @@ Extends BayesianAgent with:
 - Enhanced Black King with peek-any + swap-any-two support
 """
 
-import random
-import sys
-from pathlib import Path
+from operator import itemgetter
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from agents.bayesian_agent import BayesianAgent
-from agents.card_tracker import card_to_tuple, tuple_value
+from game import PEEK_OWN, PEEK_OPPONENT, SWAP, BLACK_KING
+from agents.bayesian_agent import BayesianAgent, _SWAP_POWER_TYPES
+from agents.card_tracker import tuple_value
 
 # Bonus added to swap score when the target position is known by its owner
 DISRUPTION_BONUS = 3
@@ -25,6 +23,8 @@ GOOD_HAND_THRESHOLD = 5
 class BayesianV2Agent(BayesianAgent):
     """Bayesian agent with disruption-aware swap targeting."""
 
+    __slots__ = ()
+
     def __init__(self, name="BayesianV2Agent", discard_threshold=None,
                  cambio_threshold=10, cambio_margin=4, cambio_knowledge_gap=1,
                  ev_dominance_margin=8):
@@ -85,7 +85,7 @@ class BayesianV2Agent(BayesianAgent):
             self.tracker.opponent_gains_knowledge(acting, swap_position)
 
         # Blind/king swap: both participants lose knowledge of swapped positions
-        if power_type in ('blind_swap', 'king_swap'):
+        if power_type in _SWAP_POWER_TYPES:
             # The initiator loses knowledge of their swap_position
             if swap_position is not None:
                 self.tracker.opponent_loses_knowledge(acting, swap_position)
@@ -124,16 +124,19 @@ class BayesianV2Agent(BayesianAgent):
         best_opp = None
         best_pos = None
         best_score = float('-inf')
+        opponent_hands = self.tracker.opponent_hands
+        knowledge_mask = self.tracker.opponent_knowledge_mask
 
         for opp in opponents:
-            if opp.name not in self.tracker.opponent_hands:
+            positions = opponent_hands.get(opp.name)
+            if positions is None:
                 continue
-            opp_knowledge = self.tracker.get_opponent_self_knowledge(opp.name)
-            for pos, card in self.tracker.opponent_hands[opp.name].items():
-                if card is not None and pos < len(opp.hand):
-                    val = tuple_value(card[0], card[1])
-                    score = -val
-                    if pos in opp_knowledge:
+            opp_knowledge = knowledge_mask(opp.name)
+            hand_size = len(opp.hand)
+            for pos, card in positions.items():
+                if card is not None and pos < hand_size:
+                    score = -tuple_value(card[0], card[1])
+                    if opp_knowledge >> pos & 1:
                         score += DISRUPTION_BONUS
                     if score > best_score:
                         best_score = score
@@ -157,32 +160,34 @@ class BayesianV2Agent(BayesianAgent):
         Returns (opp1, pos1, opp2, pos2) or None.
         """
         candidates = []
+        e_unknown = self.tracker.expected_value_of_unknown()
+        opponent_hands = self.tracker.opponent_hands
         for opp in opponents:
-            if opp.name not in self.tracker.opponent_hands:
+            positions = opponent_hands.get(opp.name)
+            if positions is None:
                 continue
-            opp_knowledge = self.tracker.get_opponent_self_knowledge(opp.name)
-            for pos, card in self.tracker.opponent_hands[opp.name].items():
-                if pos in opp_knowledge and pos < len(opp.hand):
+            opp_knowledge = self.tracker.opponent_knowledge_mask(opp.name)
+            hand_size = len(opp.hand)
+            for pos, card in positions.items():
+                if opp_knowledge >> pos & 1 and pos < hand_size:
                     # We prefer disrupting known positions; card value is secondary
-                    val = tuple_value(card[0], card[1]) if card is not None else self.tracker.expected_value_of_unknown()
+                    val = tuple_value(card[0], card[1]) if card is not None else e_unknown
                     candidates.append((opp, pos, val))
 
         # Need at least 2 candidates from different opponents
         if len(candidates) < 2:
             return None
 
-        # Sort by value ascending (disrupt known-low cards first — opponents value these most)
-        candidates.sort(key=lambda x: x[2])
-
-        # Find best pair from different opponents
-        for i in range(len(candidates)):
-            for j in range(i + 1, len(candidates)):
-                opp1, pos1, _ = candidates[i]
-                opp2, pos2, _ = candidates[j]
-                if opp1.name != opp2.name:
-                    return (opp1, pos1, opp2, pos2)
-
-        return None
+        # Disrupt known-low cards first (opponents value these most): the lowest candidate,
+        # paired with the lowest one held by a different opponent. min() keeps the first of
+        # equal values, so ties break in the same order a stable sort would give.
+        by_value = itemgetter(2)
+        opp1, pos1, _ = min(candidates, key=by_value)
+        others = [c for c in candidates if c[0].name != opp1.name]
+        if not others:
+            return None
+        opp2, pos2, _ = min(others, key=by_value)
+        return (opp1, pos1, opp2, pos2)
 
     # ------------------------------------------------------------------
     # Power action decision — override for J/Q and Black King
@@ -192,16 +197,16 @@ class BayesianV2Agent(BayesianAgent):
         """Enhanced power usage with disruption and third-party swaps."""
         self._ensure_initialized(game)
 
-        if card.rank in ['7', '8']:
+        if card.power_kind == PEEK_OWN:
             return super().choose_power_action(card, game, opponents)
 
-        elif card.rank in ['9', '10']:
+        elif card.power_kind == PEEK_OPPONENT:
             return super().choose_power_action(card, game, opponents)
 
-        elif card.rank in ['J', 'Q']:
+        elif card.power_kind == SWAP:
             return self._choose_jq_action(card, game, opponents)
 
-        elif card.rank == 'K' and card.suit in ['Spades', 'Clubs']:
+        elif card.power_kind == BLACK_KING:
             return self._choose_black_king_action(card, game, opponents)
 
         return None
@@ -225,9 +230,9 @@ class BayesianV2Agent(BayesianAgent):
                         'opp_position': opp_pos,
                     }
                 # Fallback: random opponent
-                opp = random.choice(opponents)
+                opp = self.rng.choice(opponents)
                 if opp.hand:
-                    opp_pos = random.randint(0, len(opp.hand) - 1)
+                    opp_pos = self.rng.randint(0, len(opp.hand) - 1)
                     return {
                         'type': 'blind_swap',
                         'my_position': worst_pos,
@@ -272,7 +277,8 @@ class BayesianV2Agent(BayesianAgent):
         if hand_is_strong and len(opponents) >= 2:
             # Disruption mode: peek for intel, then swap two opponents' known positions
             # Prefer peeking own unknown positions (self-intel is most valuable)
-            me = game.players[game.players.index(self)] if self in game.players else None
+            # We're the acting player, so we're seated in this game; no need to look ourselves up
+            me = self
             peek_target = self._find_best_peek_target_any(me, opponents)
             disruption = self._find_best_disruption_swap(opponents)
             if peek_target and disruption:
@@ -301,7 +307,7 @@ class BayesianV2Agent(BayesianAgent):
                 if len(unknown_pos) > most_unknowns:
                     most_unknowns = len(unknown_pos)
                     best_opp = opp
-                    target_pos = random.choice(unknown_pos) if unknown_pos else None
+                    target_pos = self.rng.choice(unknown_pos) if unknown_pos else None
 
             if best_opp and target_pos is not None:
                 return {
@@ -321,23 +327,24 @@ class BayesianV2Agent(BayesianAgent):
         best_opp = None
         best_pos = None
         best_score = float('inf')
+        e_unknown = self.tracker.expected_value_of_unknown()
 
         for opp in opponents:
             unknown_pos = self.tracker.opponent_unknown_positions(opp.name)
             if not unknown_pos:
                 continue
-            opp_score = self.tracker.expected_opponent_score(opp.name)
+            opp_score = self.tracker.expected_opponent_score(opp.name, e_unknown)
             if opp_score < best_score:
                 best_score = opp_score
                 best_opp = opp
-                best_pos = random.choice(unknown_pos)
+                best_pos = self.rng.choice(unknown_pos)
 
         if best_opp is None:
             # Fallback: any opponent with unknowns
             for opp in opponents:
                 unknown_pos = self.tracker.opponent_unknown_positions(opp.name)
                 if unknown_pos:
-                    return (opp, random.choice(unknown_pos))
+                    return (opp, self.rng.choice(unknown_pos))
 
         if best_opp and best_pos is not None:
             return (best_opp, best_pos)
@@ -353,7 +360,7 @@ class BayesianV2Agent(BayesianAgent):
         # Prefer own unknown positions — self-intel is highest value
         own_unknowns = [p for p in self.tracker.own_unknown_positions() if p < len(self.hand)]
         if own_unknowns and me is not None:
-            return (me, random.choice(own_unknowns))
+            return (me, self.rng.choice(own_unknowns))
 
         # Fall back to opponent peek
         return self._find_best_peek_target(opponents)
@@ -366,19 +373,19 @@ class BayesianV2Agent(BayesianAgent):
                        player2=None, pos2=None, peek_player=None, peek_pos=None,
                        verbose=True):
         """Override for Black King extended path and conditional swap."""
-        if card.rank == 'K' and card.suit in ['Spades', 'Clubs']:
+        if card.power_kind == BLACK_KING:
             # Extended path: peek any target, then swap any two
             if peek_player and peek_pos is not None:
                 peeked = peek_player.hand[peek_pos]
-                peeked_value = peeked.get_value()
+                peeked_value = peeked.value
                 if verbose:
                     print(f"  {self.name} used Black {card} to see {peek_player.name}'s position {peek_pos}: {peeked}")
                 # Record peek in tracker — self vs opponent
                 if peek_player == self or peek_player.name == self.name:
-                    self.tracker.set_own_card(peek_pos, card_to_tuple(peeked))
+                    self.tracker.set_own_card(peek_pos, peeked)
                     self.known[peek_pos] = peeked
                 else:
-                    self.tracker.set_opponent_card(peek_player.name, peek_pos, card_to_tuple(peeked))
+                    self.tracker.set_opponent_card(peek_player.name, peek_pos, peeked)
 
                 # Third-party swap
                 if opponent and player2 and opp_pos is not None and pos2 is not None:
@@ -391,7 +398,7 @@ class BayesianV2Agent(BayesianAgent):
                 if opponent and my_pos is not None and opp_pos is not None:
                     peek_is_opp = (peek_player == opponent and peek_pos == opp_pos)
                     if peek_is_opp:
-                        my_card_value = self.hand[my_pos].get_value()
+                        my_card_value = self.hand[my_pos].value
                         if peeked_value < my_card_value:
                             game.swap(self, opponent, my_pos, opp_pos)
                             if verbose:
@@ -411,11 +418,11 @@ class BayesianV2Agent(BayesianAgent):
             # Original conditional swap path (backward compat with king_swap type)
             if opponent and my_pos is not None and opp_pos is not None:
                 peeked = opponent.hand[opp_pos]
-                peeked_value = peeked.get_value()
+                peeked_value = peeked.value
                 if verbose:
                     print(f"  {self.name} used Black {card} to see {opponent.name}'s position {opp_pos}: {peeked}")
-                self.tracker.set_opponent_card(opponent.name, opp_pos, card_to_tuple(peeked))
-                my_card_value = self.hand[my_pos].get_value()
+                self.tracker.set_opponent_card(opponent.name, opp_pos, peeked)
+                my_card_value = self.hand[my_pos].value
                 if peeked_value < my_card_value:
                     game.swap(self, opponent, my_pos, opp_pos)
                     if verbose:
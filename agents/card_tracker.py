@@ -1,5 +1,7 @@
 """Tracks all 54 cards in a Cambio game across known locations."""
 
+from collections import Counter
+
 from game import Card
 
 
@@ -9,57 +11,129 @@ RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
 TOTAL_JOKERS = 2
 
 
+# Rank values with an unknown suit: Kings count as 10 (conservative, assume worst case)
+_RANK_VALUES = {rank: Card.get(rank, 'Spades').value for rank in RANKS}
+_RANK_VALUES['Joker'] = 0
+
+# Exact values for every (rank, suit) in the deck; tracked card tuples index this directly
+_TUPLE_VALUES = {(rank, suit): Card.get(rank, suit).value for suit in SUITS for rank in RANKS}
+_TUPLE_VALUES[('Joker', 'None')] = 0
+
+
 def card_value(rank):
     """Get numeric value for a rank string."""
-    if rank == 'A':
-        return 1
-    elif rank in ['2', '3', '4', '5', '6', '7', '8', '9', '10']:
-        return int(rank)
-    elif rank in ['J', 'Q']:
-        return 10
-    elif rank == 'K':
-        return 10  # Conservative: don't know suit, assume worst case
-    elif rank == 'Joker':
-        return 0
-    return 0
+    return _RANK_VALUES.get(rank, 0)
+
+
+_FULL_DECK = tuple((rank, suit) for suit in SUITS for rank in RANKS) + (('Joker', 'None'),) * TOTAL_JOKERS
+_FULL_DECK_COUNTS = Counter(_FULL_DECK)
+_FULL_DECK_SUM = sum(_TUPLE_VALUES[card] for card in _FULL_DECK)
 
 
 def full_deck_tuples():
-    """Return the full 54-card deck as (rank, suit) tuples."""
-    cards = []
-    for suit in SUITS:
-        for rank in RANKS:
-            cards.append((rank, suit))
-    cards.append(('Joker', 'None'))
-    cards.append(('Joker', 'None'))
-    return cards
+    """Return the full 54-card deck as (rank, suit) tuples.
+
+    The tuple is shared and built once at import; it is immutable, so callers can't disturb it.
+    """
+    return _FULL_DECK
 
 
 def card_to_tuple(card):
     """Convert a Card object to a (rank, suit) tuple."""
-    return (card.rank, card.suit)
+    return card.key
+
+
+def _tracked_value(card):
+    """Value of a (rank, suit) tuple; one outside the deck (e.g. a made-up suit) falls back to its rank."""
+    value = _TUPLE_VALUES.get(card)
+    if value is None:
+        return card_value(card[0])
+    return value
 
 
 def tuple_value(rank, suit):
     """Get numeric value for a (rank, suit) tuple."""
-    if rank == 'K':
-        if suit in ['Hearts', 'Diamonds']:
-            return -1
-        else:
-            return 10
-    return card_value(rank)
+    return _tracked_value((rank, suit))
+
+
+def _positioned(cards):
+    """(pos, card) pairs from a {pos: card} mapping or a sequence in hand order."""
+    return cards.items() if isinstance(cards, dict) else enumerate(cards)
 
 
 class CardTracker:
     """Tracks all 54 cards across locations: discard pile, own hand, opponent hands."""
 
+    __slots__ = ('discard_pile', 'own_hand', 'opponent_hands', 'opponent_hand_sizes',
+                 'opponent_self_knowledge', '_synced_pile', '_synced_cards',
+                 '_unaccounted', '_unaccounted_sum', '_unaccounted_count')
+
     def __init__(self):
         self.discard_pile = []  # list of (rank, suit) in order
         self.own_hand = {}  # {pos: (rank, suit) or None} — None means unknown
         self.opponent_hands = {}  # {name: {pos: (rank, suit) or None}}
         self.opponent_hand_sizes = {}  # {name: int}
-        self.opponent_self_knowledge = {}  # {name: set of positions they likely know}
-        self._full_deck = full_deck_tuples()
+        self.opponent_self_knowledge = {}  # {name: bitmask of positions they likely know}
+        # The game discard list last synced from, and the Card objects it held then
+        self._synced_pile = None
+        self._synced_cards = []
+        # Copies of each card not yet seen anywhere, kept in step with the three locations
+        # above. Counts go negative when a card is seen more times than the deck holds it;
+        # only the copies that were actually still unseen move the running sum and count.
+        self._unaccounted = Counter(_FULL_DECK_COUNTS)
+        self._unaccounted_sum = _FULL_DECK_SUM
+        self._unaccounted_count = len(_FULL_DECK)
+
+    def reset(self):
+        """Forget everything, reusing the existing containers rather than allocating new ones."""
+        self.discard_pile.clear()
+        self.own_hand.clear()
+        self.opponent_hands.clear()
+        self.opponent_hand_sizes.clear()
+        self.opponent_self_knowledge.clear()
+        self._synced_pile = None
+        self._synced_cards.clear()
+        self._unaccounted.clear()
+        self._unaccounted.update(_FULL_DECK_COUNTS)
+        self._unaccounted_sum = _FULL_DECK_SUM
+        self._unaccounted_count = len(_FULL_DECK)
+
+    def _account(self, card):
+        """Note a sighting of *card*, taking one copy out of the unaccounted pool."""
+        n = self._unaccounted[card]
+        self._unaccounted[card] = n - 1
+        if n > 0:
+            self._unaccounted_sum -= _TUPLE_VALUES[card]
+            self._unaccounted_count -= 1
+
+    def _release(self, card):
+        """Undo one earlier _account(card)."""
+        n = self._unaccounted[card] + 1
+        self._unaccounted[card] = n
+        if n > 0:
+            self._unaccounted_sum += _TUPLE_VALUES[card]
+            self._unaccounted_count += 1
+
+    def _set_position(self, hand, pos, card):
+        """Store *card* (or None) at hand[pos], keeping the unaccounted pool in step."""
+        old = hand.get(pos)
+        if old is not None:
+            self._release(old)
+        if card is not None:
+            self._account(card)
+        hand[pos] = card
+
+    def _set_positions(self, hand, items):
+        """_set_position for each (pos, card) in *items*; Cards are converted to tuples.
+
+        Positions already holding that card are left alone, so re-recording what is
+        already known (every turn, for most of them) costs one comparison each.
+        """
+        for pos, card in items:
+            if isinstance(card, Card):
+                card = card.key
+            if hand.get(pos) != card:
+                self._set_position(hand, pos, card)
 
     def initialize(self, own_known, hand_size, opponent_names, opponent_hand_size=4):
         """Set up tracking after deal.
@@ -68,48 +142,102 @@ class CardTracker:
         hand_size: number of cards in own hand
         opponent_names: list of opponent name strings
         """
+        for card in self.own_hand.values():
+            if card is not None:
+                self._release(card)
         self.own_hand = {}
         for pos in range(hand_size):
             if pos in own_known:
-                self.own_hand[pos] = card_to_tuple(own_known[pos])
+                self.own_hand[pos] = card = own_known[pos].key
+                self._account(card)
             else:
                 self.own_hand[pos] = None
 
         for name in opponent_names:
+            for card in self.opponent_hands.get(name, {}).values():
+                if card is not None:
+                    self._release(card)
             self.opponent_hands[name] = {pos: None for pos in range(opponent_hand_size)}
             self.opponent_hand_sizes[name] = opponent_hand_size
 
     def card_to_discard(self, card_tuple):
         """Record a card entering the discard pile."""
         self.discard_pile.append(card_tuple)
+        self._account(card_tuple)
+        self._synced_pile = None
 
     def sync_discard(self, game_discard):
         """Sync tracker discard pile with the game's discard pile.
 
-        Always replaces the tracker's list with the game state so that
-        reshuffles (which shrink the discard pile) are handled correctly.
+        The game only pushes and pops at the top of its pile (at most one card
+        is drawn back off it between syncs), so when called again with the
+        same list only the cards above the highest unchanged position are
+        re-read. A different list -- a reshuffle or a new game -- is copied
+        in full, so shrinking piles are handled correctly.
         """
-        self.discard_pile = [card_to_tuple(c) for c in game_discard]
+        if game_discard is not self._synced_pile:
+            self._synced_pile = game_discard
+            self._synced_cards = list(game_discard)
+            for card in self.discard_pile:
+                self._release(card)
+            self.discard_pile = [c.key for c in game_discard]
+            for card in self.discard_pile:
+                self._account(card)
+            return
 
-    def set_own_card(self, pos, card_tuple):
-        """Record a known card at own position (from peek or swap)."""
-        self.own_hand[pos] = card_tuple
+        synced = self._synced_cards
+        keep = min(len(synced), len(game_discard))
+        while keep and synced[keep - 1] is not game_discard[keep - 1]:
+            keep -= 1
+        added = game_discard[keep:]
+        del synced[keep:]
+        synced.extend(added)
+        for card in self.discard_pile[keep:]:
+            self._release(card)
+        del self.discard_pile[keep:]
+        for c in added:
+            card = c.key
+            self.discard_pile.append(card)
+            self._account(card)
+
+    def set_own_card(self, pos, card):
+        """Record a known card at own position (from peek or swap).
+
+        *card* may be a Card or a (rank, suit) tuple.
+        """
+        if isinstance(card, Card):
+            card = card.key
+        self._set_position(self.own_hand, pos, card)
 
-    def set_opponent_card(self, name, pos, card_tuple):
-        """Record a known card at opponent position."""
+    def set_own_cards(self, cards):
+        """Record several known own cards.
+
+        *cards* is a {pos: card} mapping, or a sequence giving positions
+        0..len(cards)-1 in hand order; each card may be a Card or a (rank, suit) tuple.
+        """
+        self._set_positions(self.own_hand, _positioned(cards))
+
+    def set_opponent_card(self, name, pos, card):
+        """Record a known card at opponent position; *card* may be a Card or a (rank, suit) tuple."""
+        if isinstance(card, Card):
+            card = card.key
         if name not in self.opponent_hands:
             self.opponent_hands[name] = {}
-        self.opponent_hands[name][pos] = card_tuple
+        self._set_position(self.opponent_hands[name], pos, card)
+
+    def set_opponent_cards(self, name, cards):
+        """Record several known opponent cards; *cards* is taken as in set_own_cards."""
+        self._set_positions(self.opponent_hands.setdefault(name, {}), _positioned(cards))
 
     def own_card_swapped_out(self, pos):
         """Mark own position as unknown (opponent blind-swapped us)."""
         if pos in self.own_hand:
-            self.own_hand[pos] = None
+            self._set_position(self.own_hand, pos, None)
 
     def clear_opponent_position(self, name, pos):
         """Mark an opponent position as unknown."""
         if name in self.opponent_hands and pos in self.opponent_hands[name]:
-            self.opponent_hands[name][pos] = None
+            self._set_position(self.opponent_hands[name], pos, None)
 
     def opponent_remove_position(self, name, pos):
         """Remove a position from an opponent's hand and shift higher positions down."""
@@ -117,6 +245,7 @@ class CardTracker:
             return
         hand = self.opponent_hands[name]
         if pos in hand:
+            self._set_position(hand, pos, None)
             del hand[pos]
         new_hand = {}
         for p, card in sorted(hand.items()):
@@ -140,6 +269,7 @@ class CardTracker:
     def remove_own_position(self, pos):
         """Remove a position from own hand and shift higher positions down."""
         if pos in self.own_hand:
+            self._set_position(self.own_hand, pos, None)
             del self.own_hand[pos]
         new_hand = {}
         for p, card in sorted(self.own_hand.items()):
@@ -162,64 +292,56 @@ class CardTracker:
         # Remove positions if hand shrank
         to_remove = [p for p in current_known if p >= new_size]
         for p in to_remove:
+            self._set_position(current_known, p, None)
             del current_known[p]
 
     def unaccounted_cards(self):
         """Cards not in discard and not in any known position.
 
-        Returns a list of (rank, suit) tuples (may contain duplicates for jokers).
+        Returns a list of (rank, suit) tuples in deck order (may contain duplicates for jokers).
         """
-        accounted = list(self.discard_pile)
-
-        for pos, card in self.own_hand.items():
-            if card is not None:
-                accounted.append(card)
-
-        for name, positions in self.opponent_hands.items():
-            for pos, card in positions.items():
-                if card is not None:
-                    accounted.append(card)
-
-        # Remove accounted cards from full deck
-        remaining = list(self._full_deck)
-        for card in accounted:
-            if card in remaining:
-                remaining.remove(card)
-
-        return remaining
+        return list(self._unaccounted.elements())
 
     def expected_value_of_unknown(self):
-        """Mean value of unaccounted cards."""
-        remaining = self.unaccounted_cards()
-        if not remaining:
+        """Mean value of unaccounted cards, from the running sum and count."""
+        if not self._unaccounted_count:
             return 5.0  # Fallback
-        return sum(tuple_value(r, s) for r, s in remaining) / len(remaining)
+        return self._unaccounted_sum / self._unaccounted_count
+
+    def expected_value_at_position(self, pos, e_unknown=None):
+        """Exact value if known, E[unknown] otherwise.
 
-    def expected_value_at_position(self, pos):
-        """Exact value if known, E[unknown] otherwise."""
+        Pass *e_unknown* when evaluating several positions against the same
+        tracker state to avoid recomputing it each time.
+        """
         card = self.own_hand.get(pos)
         if card is not None:
-            return tuple_value(card[0], card[1])
-        return self.expected_value_of_unknown()
+            return _tracked_value(card)
+        if e_unknown is None:
+            return self.expected_value_of_unknown()
+        return e_unknown
 
-    def expected_own_score(self):
+    def expected_own_score(self, e_unknown=None):
         """Sum of expected values across all own hand positions."""
-        return sum(self.expected_value_at_position(pos) for pos in self.own_hand)
+        if e_unknown is None and self.own_unknown_positions():
+            e_unknown = self.expected_value_of_unknown()
+        return sum(self.expected_value_at_position(pos, e_unknown) for pos in self.own_hand)
 
-    def expected_opponent_score(self, name):
+    def expected_opponent_score(self, name, e_unknown=None):
         """Sum of expected values across all opponent hand positions."""
+        if e_unknown is None:
+            e_unknown = self.expected_value_of_unknown()
         if name not in self.opponent_hands:
             hand_size = self.opponent_hand_sizes.get(name, 4)
-            return hand_size * self.expected_value_of_unknown()
+            return hand_size * e_unknown
 
-        e_unknown = self.expected_value_of_unknown()
         total = 0.0
         hand_size = self.opponent_hand_sizes.get(name, 4)
         positions = self.opponent_hands[name]
         for pos in range(hand_size):
             card = positions.get(pos)
             if card is not None:
-                total += tuple_value(card[0], card[1])
+                total += _tracked_value(card)
             else:
                 total += e_unknown
         return total
@@ -245,7 +367,7 @@ class CardTracker:
         worst_val = -2
         for pos, card in self.own_hand.items():
             if card is not None:
-                val = tuple_value(card[0], card[1])
+                val = _tracked_value(card)
                 if val > worst_val:
                     worst_val = val
                     worst_pos = pos
@@ -259,19 +381,22 @@ class CardTracker:
 
     def init_opponent_self_knowledge(self, name):
         """Initialize: every player knows positions 0 and 1 after deal."""
-        self.opponent_self_knowledge[name] = {0, 1}
+        self.opponent_self_knowledge[name] = 0b11
 
     def opponent_gains_knowledge(self, name, pos):
         """Record that an opponent now knows a position in their own hand."""
-        if name not in self.opponent_self_knowledge:
-            self.opponent_self_knowledge[name] = set()
-        self.opponent_self_knowledge[name].add(pos)
+        self.opponent_self_knowledge[name] = self.opponent_self_knowledge.get(name, 0) | (1 << pos)
 
     def opponent_loses_knowledge(self, name, pos):
         """Record that an opponent no longer knows a position in their own hand."""
         if name in self.opponent_self_knowledge:
-            self.opponent_self_knowledge[name].discard(pos)
+            self.opponent_self_knowledge[name] &= ~(1 << pos)
+
+    def opponent_knowledge_mask(self, name):
+        """Bitmask of the positions an opponent likely knows (bit *pos* set if known)."""
+        return self.opponent_self_knowledge.get(name, 0)
 
     def get_opponent_self_knowledge(self, name):
         """Return the set of positions an opponent likely knows."""
-        return self.opponent_self_knowledge.get(name, set())
+        mask = self.opponent_self_knowledge.get(name, 0)
+        return {pos for pos in range(mask.bit_length()) if mask >> pos & 1}
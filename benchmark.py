@@ -176,7 +176,9 @@ def run_benchmarks(show_charts=True):
         configs = matchup['configs']
         print(f"\nRunning: {name} ({NUM_MATCHES} matches) ...")
 
-        tourney = Tournament(configs, num_matches=NUM_MATCHES, point_limit=POINT_LIMIT)
+        tourney = Tournament(configs, num_matches=NUM_MATCHES, point_limit=POINT_LIMIT,
+                             keep_round_detail=True, keep_values=True,
+                             collect_match_results=True)
         result = tourney.play()
         summary = result['summary']
         sample_match = result['match_results'][0]
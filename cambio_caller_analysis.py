@@ -131,7 +131,8 @@ def run_analysis(show_charts=True):
             label = f"gap=1" if variant == 'default' else "gap=0"
             print(f"\n  [{label}] Running {NUM_MATCHES} matches ...")
 
-            tourney = Tournament(configs, num_matches=NUM_MATCHES, point_limit=POINT_LIMIT)
+            tourney = Tournament(configs, num_matches=NUM_MATCHES, point_limit=POINT_LIMIT,
+                                 keep_round_detail=True, collect_match_results=True)
             result = tourney.play()
             summary = result['summary']
 
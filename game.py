@@ -1,69 +1,220 @@
+import copy
 import random
+from dataclasses import dataclass, field
+
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+RANKS = ['A','2','3','4','5','6','7','8','9','10','J','Q','K']
+POWER_RANKS = frozenset(['7','8','9','10','J','Q','K'])
+RED_SUITS = frozenset(['Hearts', 'Diamonds'])
+BLACK_SUITS = frozenset(['Spades', 'Clubs'])
+_NUMBER_RANKS = frozenset(RANKS[1:10])
+_FACE_RANKS = frozenset(['J', 'Q'])
+
+# Cards are encoded as small ints: rank index in the high bits, suit index in the
+# low two bits, so ``code >> 2`` compares ranks. Both Jokers share one code.
+_RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+_RANK_INDEX['Joker'] = len(RANKS)
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+_SUIT_INDEX['None'] = 0
+
+
+def card_code(rank, suit):
+    """Integer code for a (rank, suit) pair."""
+    return (_RANK_INDEX[rank] << 2) | _SUIT_INDEX[suit]
+
+
+def _rank_suit_value(rank, suit):
+    if rank == 'A':
+        return 1
+    elif rank in _NUMBER_RANKS:
+        return int(rank)
+    elif rank in _FACE_RANKS:
+        return 10
+    elif rank == 'K':
+        if suit in RED_SUITS:
+            return -1
+        else:
+            return 10
+    return 0
+
+
+# Power kinds, grouped by what the discarded card lets its player do
+PEEK_OWN = 'peek_own'
+PEEK_OPPONENT = 'peek_opponent'
+SWAP = 'swap'
+BLACK_KING = 'black_king'
+_POWER_KIND_BY_RANK = {'7': PEEK_OWN, '8': PEEK_OWN, '9': PEEK_OPPONENT, '10': PEEK_OPPONENT,
+                       'J': SWAP, 'Q': SWAP}
+
+
+def _rank_suit_power_kind(rank, suit):
+    if rank == 'K':
+        return BLACK_KING if suit in BLACK_SUITS else None
+    return _POWER_KIND_BY_RANK.get(rank)
+
+
+# Lookup tables indexed by card code
+CARD_VALUES = tuple(
+    _rank_suit_value(RANKS[code >> 2], SUITS[code & 3]) if (code >> 2) < len(RANKS) else 0
+    for code in range((len(RANKS) + 1) << 2)
+)
+CARD_HAS_POWER = tuple(
+    (code >> 2) < len(RANKS) and RANKS[code >> 2] in POWER_RANKS
+    for code in range((len(RANKS) + 1) << 2)
+)
+CARD_POWER_KINDS = tuple(
+    _rank_suit_power_kind(RANKS[code >> 2], SUITS[code & 3]) if (code >> 2) < len(RANKS) else None
+    for code in range((len(RANKS) + 1) << 2)
+)
 
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Card:
-    def __init__(self, rank, suit):
-        self.rank = rank
-        self.suit = suit
-    
+    """An immutable playing card; equal (and hashed) by rank and suit, via its code.
+
+    key (the (rank, suit) tuple), code, value, power and power_kind are derived
+    from rank and suit once, at construction. Use Card.get to share one
+    instance per (rank, suit).
+    """
+    rank: str
+    suit: str
+    key: tuple = field(init=False, compare=False)
+    code: int = field(init=False, compare=False)
+    value: int = field(init=False, compare=False)
+    power: bool = field(init=False, compare=False)
+    power_kind: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        code = card_code(self.rank, self.suit)
+        object.__setattr__(self, 'key', (self.rank, self.suit))
+        object.__setattr__(self, 'code', code)
+        object.__setattr__(self, 'value', CARD_VALUES[code])
+        object.__setattr__(self, 'power', CARD_HAS_POWER[code])
+        object.__setattr__(self, 'power_kind', CARD_POWER_KINDS[code])
+
+    @classmethod
+    def get(cls, rank, suit):
+        """The shared Card for *rank*/*suit*, created on first use."""
+        card = _CARD_INTERN.get((rank, suit))
+        if card is None:
+            card = _CARD_INTERN[(rank, suit)] = cls(rank, suit)
+        return card
+
+    def __eq__(self, other):
+        if other.__class__ is Card:
+            return self.code == other.code
+        return NotImplemented
+
+    def __hash__(self):
+        return self.code
+
     def get_value(self):
-        if self.rank == 'A':
-            return 1
-        elif self.rank in ['2','3','4','5','6','7','8','9','10']:
-            return int(self.rank)
-        elif self.rank in ['J', 'Q']:
-            return 10
-        elif self.rank == 'K':
-            if self.suit in ['Hearts', 'Diamonds']:
-                return -1
-            else:
-                return 10
-        elif self.rank == 'Joker':
-            return 0
-        return 0
+        return self.value
     
     def has_power(self):
-        return self.rank in ['7','8','9','10','J','Q','K']
+        return self.power
     
     def __repr__(self):
         if self.rank == 'Joker':
             return "Joker"
         return f"{self.rank}{self.suit[0]}"
 
+
+_CARD_INTERN = {}
+
+
+def cards_to_strings(cards):
+    """Render a sequence of cards the way they print, e.g. ['7H', 'Joker']."""
+    return [repr(c) for c in cards]
+
+
+# One set of 54 cards shared by every Deck; cards are immutable, so both Jokers can be one instance
+_DECK_TEMPLATE = tuple(Card.get(rank, suit) for suit in SUITS for rank in RANKS) + (
+    Card.get('Joker', 'None'),) * 2
+
+
+# Keys recorded for every turn; play_turn copies this and fills in what happened
+_TURN_DATA_TEMPLATE = {
+    'turn_number': None,
+    'player': None,
+    'draw_source': None,
+    'drawn_card': None,
+    'drawn_value': None,
+    'action': None,
+    'power_type': None,
+    'swap_position': None,
+    'cambio_called': False,
+    'hand_size': None,
+    'discarded_card': None,
+    'discarded_value': None,
+    'power_target_player': None,
+    'power_target_position': None,
+    'power_target_player2': None,
+    'power_target_position2': None,
+    'power_peek_player': None,
+    'power_peek_position': None,
+}
+
+
 class Deck:
-    def __init__(self):
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        ranks = ['A','2','3','4','5','6','7','8','9','10','J','Q','K']
-        
-        self.cards = []
-        for suit in suits:
-            for rank in ranks:
-                self.cards.append(Card(rank, suit))
-        
-        self.cards.append(Card('Joker', 'None'))
-        self.cards.append(Card('Joker', 'None'))
-        
-        random.shuffle(self.cards)
+    __slots__ = ('cards', 'rng')
+
+    def __init__(self, rng=None, shuffle=True):
+        # None shuffles with the module-level random functions
+        self.rng = rng
+        self.cards = list(_DECK_TEMPLATE)
+        if shuffle:
+            self.shuffle()
+
+    def shuffle(self):
+        (random if self.rng is None else self.rng).shuffle(self.cards)
     
     def draw(self):
-        if len(self.cards) > 0:
+        if self.cards:
             return self.cards.pop()
         return None
+
+    def refill(self, cards):
+        """Shuffle *cards* in place and slide them under whatever is left; takes ownership of the list."""
+        (random if self.rng is None else self.rng).shuffle(cards)
+        cards.extend(self.cards)
+        self.cards = cards
     
     def size(self):
         return len(self.cards)
     
     def is_empty(self):
-        return len(self.cards) == 0
+        return not self.cards
 
 class Player:
+    # Agent subclasses declare their own __slots__ for the state they add
+    __slots__ = ('name', 'hand', 'known', '_rng')
+
     def __init__(self, name):
         self.name = name
         self.hand = []
         self.known = {}
+        # Source of any random choices; None means the module-level random functions.
+        # Kept as None rather than the random module so players can be copied and pickled
+        self._rng = None
+
+    @property
+    def rng(self):
+        """The generator this player's random choices come from; CambioGame sets it when seating."""
+        return random if self._rng is None else self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        self._rng = rng
 
     def set_hand(self, cards):
         self.hand = cards
 
+    def reset(self):
+        """Clear per-game state so the same player can sit down for another game."""
+        self.hand = []
+        self.known = {}
+
     def choose_draw(self, game):
         return 'deck'
 
@@ -88,21 +239,22 @@ class Player:
     def use_card_power(self, card, game, opponent=None, my_pos=None, opp_pos=None,
                         player2=None, pos2=None, peek_player=None, peek_pos=None,
                         verbose=True):
-        if card.rank in ['7', '8']:
+        kind = card.power_kind
+        if kind == PEEK_OWN:
             if my_pos is not None and 0 <= my_pos < len(self.hand):
                 game.peek(self, my_pos)
                 if verbose:
                     print(f"  {self.name} used {card} to peek at own position {my_pos}: {self.hand[my_pos]}")
                 return True
 
-        elif card.rank in ['9', '10']:
+        elif kind == PEEK_OPPONENT:
             if opponent and opp_pos is not None and 0 <= opp_pos < len(opponent.hand):
                 peeked = opponent.hand[opp_pos]
                 if verbose:
                     print(f"  {self.name} used {card} to peek at {opponent.name}'s position {opp_pos}: {peeked}")
                 return True
 
-        elif card.rank in ['J', 'Q']:
+        elif kind == SWAP:
             # Third-party swap: swap opponent[opp_pos] with player2[pos2]
             if opponent and player2 and opp_pos is not None and pos2 is not None:
                 game.swap(opponent, player2, opp_pos, pos2)
@@ -116,7 +268,7 @@ class Player:
                     print(f"  {self.name} used {card} to blind swap position {my_pos} with {opponent.name}'s position {opp_pos}")
                 return True
 
-        elif card.rank == 'K' and card.suit in ['Spades', 'Clubs']:
+        elif kind == BLACK_KING:
             # Extended Black King: peek any card, then swap any two
             if peek_player and peek_pos is not None:
                 peeked = peek_player.hand[peek_pos]
@@ -149,16 +301,83 @@ class Player:
         return False
 
 class CambioGame:
-    def __init__(self, players):
-        self.deck = Deck()
+    __slots__ = ('rng', 'deck', 'discard', 'players', 'current_player', 'cambio_called', 'cambio_caller',
+                 'final_round_active', '_turn_observers', '_stick_observers', '_stickers', '_opponents',
+                 '_seats')
+
+    def __init__(self, players, rng=None):
+        """
+        rng: a random.Random used for shuffling and by every seated player, so a
+            seeded generator makes the whole game reproducible. Defaults to the
+            module-level random functions.
+
+        The deck starts in order; deal() shuffles it.
+        """
+        self.rng = rng
+        # Seat everyone on this game's generator, so none keeps one from an earlier seeded game
+        for p in players:
+            p.rng = rng
+        self.deck = Deck(self.rng, shuffle=False)
         self.discard = []
         self.players = players
         self.current_player = 0
         self.cambio_called = False
         self.cambio_caller = None
         self.final_round_active = False
+        # Only players that override the no-op observer hooks need to be notified
+        self._turn_observers = [p for p in players if type(p).observe_turn is not Player.observe_turn]
+        self._stick_observers = [p for p in players if type(p).observe_stick is not Player.observe_stick]
+        # Seats whose policy can ever stick; the default choose_stick always passes
+        self._stickers = [type(p).choose_stick is not Player.choose_stick for p in players]
+        # Opponents of each seat, built once; tuples so a policy can't mutate the shared copy
+        self._opponents = [tuple(p for j, p in enumerate(players) if j != i) for i in range(len(players))]
+        self._seats = {id(p): i for i, p in enumerate(players)}
     
-    def deal(self):
+    def reset(self, seed=None):
+        """Start a new game with the same players: fresh deck, cleared hands.
+
+        As in __init__, the deck stays in order until deal() shuffles it.
+
+        seed: if given, the game and its players switch to a new random.Random(seed),
+            so the next game plays out exactly as one constructed with that generator.
+        """
+        if seed is not None:
+            self.rng = random.Random(seed)
+            for p in self.players:
+                p.rng = self.rng
+        self.deck = Deck(self.rng, shuffle=False)
+        self.discard = []
+        self.current_player = 0
+        self.cambio_called = False
+        self.cambio_caller = None
+        self.final_round_active = False
+        for p in self.players:
+            p.reset()
+
+    def __deepcopy__(self, memo):
+        """Copy the game with its players, deck and discard pile.
+
+        Seat lookups are rebuilt for the copied players.
+        """
+        clone = type(self).__new__(type(self))
+        memo[id(self)] = clone
+        for name in self.__slots__:
+            setattr(clone, name, copy.deepcopy(getattr(self, name), memo))
+        clone._seats = {id(p): i for i, p in enumerate(clone.players)}
+        return clone
+
+    def player_index(self, player):
+        """Seat index of *player*, without scanning the player list."""
+        return self._seats[id(player)]
+
+    def deal(self, shuffle=True):
+        """Shuffle the deck, deal four cards to each player and turn up the first discard.
+
+        The deck is left in order until now; shuffle=False deals it as is, for
+        tests that set up hands themselves and don't need a random deal.
+        """
+        if shuffle:
+            self.deck.shuffle()
         for p in self.players:
             p.set_hand([self.deck.draw() for _ in range(4)])
         
@@ -174,11 +393,9 @@ class CambioGame:
         """Shuffle all discard pile cards except the top one back into the deck."""
         if len(self.discard) <= 1:
             return
-        top = self.discard[-1]
-        reshuffle_cards = self.discard[:-1]
-        self.discard = [top]
-        self.deck.cards.extend(reshuffle_cards)
-        random.shuffle(self.deck.cards)
+        reshuffle_cards = self.discard
+        self.discard = [reshuffle_cards.pop()]
+        self.deck.refill(reshuffle_cards)
 
     def swap(self, p1, p2, i1, i2):
         tmp = p1.hand[i1]
@@ -197,19 +414,14 @@ class CambioGame:
         top_card = self.discard[-1]
         player_card = player.hand[position]
 
-        if player_card.rank == top_card.rank:
+        if player_card.code >> 2 == top_card.code >> 2:
             stuck_card = player.hand.pop(position)
             self.discard.append(stuck_card)
-            if position in player.known:
-                del player.known[position]
-
-            new_known = {}
-            for pos, card in player.known.items():
-                if pos > position:
-                    new_known[pos - 1] = card
-                else:
-                    new_known[pos] = card
-            player.known = new_known
+            # Drop the stuck slot and shift later positions down in one pass
+            player.known = {
+                (pos - 1 if pos > position else pos): card
+                for pos, card in player.known.items() if pos != position
+            }
 
             if verbose:
                 print(f"  {player.name} successfully stuck {stuck_card}!")
@@ -223,19 +435,93 @@ class CambioGame:
             return False
     
     def calculate_score(self, player):
-        return sum(card.get_value() for card in player.hand)
+        return sum(card.value for card in player.hand)
     
     def score_game(self):
-        w_score = 1000
-        w_name = ""
-        for p in self.players:
-            current = self.calculate_score(p)
-            if current < w_score:
-                w_score = current
-                w_name = p.name
-        return f'"{w_name}" wins with a score of {w_score}!'
+        scores = [self.calculate_score(p) for p in self.players]
+        # min() keeps the first player on ties, like the old strict-< scan
+        winner = min(range(len(scores)), key=scores.__getitem__)
+        return f'"{self.players[winner].name}" wins with a score of {scores[winner]}!'
     
-    def play_turn(self, turn_number=0, verbose=True):
+    # -- Power handlers, dispatched on power_action['type'] ---------------------
+
+    def _power_peek_own(self, player, card, power_action, turn_data, verbose):
+        pos = power_action['position']
+        player.use_card_power(card, self, my_pos=pos, verbose=verbose)
+
+    def _power_peek_opponent(self, player, card, power_action, turn_data, verbose):
+        opp = power_action['opponent']
+        pos = power_action['position']
+        player.use_card_power(card, self, opponent=opp, opp_pos=pos, verbose=verbose)
+        turn_data['power_target_player'] = opp.name
+        turn_data['power_target_position'] = pos
+        if hasattr(player, 'opponent_known'):
+            opp_id = self.player_index(opp)
+            if opp_id not in player.opponent_known:
+                player.opponent_known[opp_id] = {}
+            player.opponent_known[opp_id][pos] = opp.hand[pos]
+
+    def _power_third_party_swap(self, player, card, power_action, turn_data, verbose):
+        opp1 = power_action['opponent']
+        pos1 = power_action['opp_position']
+        opp2 = power_action['player2']
+        pos2 = power_action['position2']
+        turn_data['power_target_player'] = opp1.name
+        turn_data['power_target_position'] = pos1
+        turn_data['power_target_player2'] = opp2.name
+        turn_data['power_target_position2'] = pos2
+        player.use_card_power(card, self, opponent=opp1, opp_pos=pos1,
+                              player2=opp2, pos2=pos2, verbose=verbose)
+
+    def _power_king_peek_swap(self, player, card, power_action, turn_data, verbose):
+        # Black King: peek any card, then optionally swap any two
+        pk_player = power_action['peek_player']
+        pk_pos = power_action['peek_position']
+        turn_data['power_peek_player'] = pk_player.name
+        turn_data['power_peek_position'] = pk_pos
+        swap_info = power_action.get('swap')
+        if swap_info:
+            s_p1 = swap_info['player1']
+            s_pos1 = swap_info['position1']
+            s_p2 = swap_info['player2']
+            s_pos2 = swap_info['position2']
+            turn_data['power_target_player'] = s_p1.name
+            turn_data['power_target_position'] = s_pos1
+            turn_data['power_target_player2'] = s_p2.name
+            turn_data['power_target_position2'] = s_pos2
+            # Determine if self is involved in the swap
+            if s_p1 == player:
+                turn_data['swap_position'] = s_pos1
+            elif s_p2 == player:
+                turn_data['swap_position'] = s_pos2
+            player.use_card_power(card, self, opponent=s_p1, opp_pos=s_pos1,
+                                  player2=s_p2, pos2=s_pos2,
+                                  peek_player=pk_player, peek_pos=pk_pos,
+                                  verbose=verbose)
+        else:
+            # Peek only, no swap
+            player.use_card_power(card, self, peek_player=pk_player, peek_pos=pk_pos,
+                                  verbose=verbose)
+
+    def _power_swap(self, player, card, power_action, turn_data, verbose):
+        opp = power_action['opponent']
+        my_pos = power_action['my_position']
+        opp_pos = power_action['opp_position']
+        turn_data['swap_position'] = my_pos
+        turn_data['power_target_player'] = opp.name
+        turn_data['power_target_position'] = opp_pos
+        player.use_card_power(card, self, opponent=opp, my_pos=my_pos, opp_pos=opp_pos, verbose=verbose)
+
+    _POWER_HANDLERS = {
+        'peek_own': _power_peek_own,
+        'peek_opponent': _power_peek_opponent,
+        'third_party_swap': _power_third_party_swap,
+        'king_peek_swap': _power_king_peek_swap,
+        'blind_swap': _power_swap,
+        'king_swap': _power_swap,
+    }
+
+    def play_turn(self, turn_number=0, verbose=True, record_strings=False):
         player = self.players[self.current_player]
         if verbose:
             print(f"\n--- {player.name}'s turn ---")
@@ -245,28 +531,12 @@ class CambioGame:
 
         draw_choice = player.choose_draw(self)
 
-        turn_data = {
-            'turn_number': turn_number,
-            'player': player.name,
-            'draw_source': None,
-            'drawn_card': None,
-            'drawn_value': None,
-            'action': None,
-            'power_type': None,
-            'swap_position': None,
-            'cambio_called': False,
-            'hand_size': len(player.hand),
-            'discarded_card': None,
-            'discarded_value': None,
-            'power_target_player': None,
-            'power_target_position': None,
-            'power_target_player2': None,
-            'power_target_position2': None,
-            'power_peek_player': None,
-            'power_peek_position': None,
-        }
+        turn_data = _TURN_DATA_TEMPLATE.copy()
+        turn_data['turn_number'] = turn_number
+        turn_data['player'] = player.name
+        turn_data['hand_size'] = len(player.hand)
 
-        if draw_choice == 'discard' and len(self.discard) > 0:
+        if draw_choice == 'discard' and self.discard:
             drawn_card = self.discard.pop()
             turn_data['draw_source'] = 'discard'
             if verbose:
@@ -282,96 +552,27 @@ class CambioGame:
                 print("No cards left!")
             return turn_data
 
-        turn_data['drawn_card'] = repr(drawn_card)
-        turn_data['drawn_value'] = drawn_card.get_value()
+        turn_data['drawn_card'] = repr(drawn_card) if record_strings else drawn_card
+        turn_data['drawn_value'] = drawn_card.value
 
         # Check if card has power and agent wants to use it
-        if drawn_card.has_power() and hasattr(player, 'choose_power_action'):
-            opponents = [p for i, p in enumerate(self.players) if i != self.current_player]
-            power_action = player.choose_power_action(drawn_card, self, opponents)
+        if drawn_card.power and hasattr(player, 'choose_power_action'):
+            power_action = player.choose_power_action(drawn_card, self, self._opponents[self.current_player])
 
             if power_action:
                 turn_data['action'] = 'power'
-                turn_data['power_type'] = power_action['type']
-
-                if power_action['type'] == 'peek_own':
-                    pos = power_action['position']
-                    player.use_card_power(drawn_card, self, my_pos=pos, verbose=verbose)
-
-                elif power_action['type'] == 'peek_opponent':
-                    opp = power_action['opponent']
-                    pos = power_action['position']
-                    player.use_card_power(drawn_card, self, opponent=opp, opp_pos=pos, verbose=verbose)
-                    turn_data['power_target_player'] = opp.name
-                    turn_data['power_target_position'] = pos
-                    if hasattr(player, 'opponent_known'):
-                        opp_id = self.players.index(opp)
-                        if opp_id not in player.opponent_known:
-                            player.opponent_known[opp_id] = {}
-                        player.opponent_known[opp_id][pos] = opp.hand[pos]
-
-                elif power_action['type'] == 'third_party_swap':
-                    opp1 = power_action['opponent']
-                    pos1 = power_action['opp_position']
-                    opp2 = power_action['player2']
-                    pos2 = power_action['position2']
-                    turn_data['power_target_player'] = opp1.name
-                    turn_data['power_target_position'] = pos1
-                    turn_data['power_target_player2'] = opp2.name
-                    turn_data['power_target_position2'] = pos2
-                    player.use_card_power(drawn_card, self, opponent=opp1, opp_pos=pos1,
-                                          player2=opp2, pos2=pos2, verbose=verbose)
-
-                elif power_action['type'] == 'king_peek_swap':
-                    # Black King: peek any card, then optionally swap any two
-                    pk_player = power_action['peek_player']
-                    pk_pos = power_action['peek_position']
-                    turn_data['power_peek_player'] = pk_player.name
-                    turn_data['power_peek_position'] = pk_pos
-                    swap_info = power_action.get('swap')
-                    if swap_info:
-                        s_p1 = swap_info['player1']
-                        s_pos1 = swap_info['position1']
-                        s_p2 = swap_info['player2']
-                        s_pos2 = swap_info['position2']
-                        turn_data['power_target_player'] = s_p1.name
-                        turn_data['power_target_position'] = s_pos1
-                        turn_data['power_target_player2'] = s_p2.name
-                        turn_data['power_target_position2'] = s_pos2
-                        # Determine if self is involved in the swap
-                        if s_p1 == player:
-                            turn_data['swap_position'] = s_pos1
-                        elif s_p2 == player:
-                            turn_data['swap_position'] = s_pos2
-                        player.use_card_power(drawn_card, self, opponent=s_p1, opp_pos=s_pos1,
-                                              player2=s_p2, pos2=s_pos2,
-                                              peek_player=pk_player, peek_pos=pk_pos,
-                                              verbose=verbose)
-                    else:
-                        # Peek only, no swap
-                        player.use_card_power(drawn_card, self, peek_player=pk_player, peek_pos=pk_pos,
-                                              verbose=verbose)
-
-                elif power_action['type'] in ['blind_swap', 'king_swap']:
-                    opp = power_action['opponent']
-                    my_pos = power_action['my_position']
-                    opp_pos = power_action['opp_position']
-                    turn_data['swap_position'] = my_pos
-                    turn_data['power_target_player'] = opp.name
-                    turn_data['power_target_position'] = opp_pos
-                    player.use_card_power(drawn_card, self, opponent=opp, my_pos=my_pos, opp_pos=opp_pos, verbose=verbose)
+                power_type = power_action['type']
+                turn_data['power_type'] = power_type
+
+                handler = self._POWER_HANDLERS.get(power_type)
+                if handler is not None:
+                    handler(self, player, drawn_card, power_action, turn_data, verbose)
 
                 self.discard.append(drawn_card)
-                turn_data['discarded_card'] = repr(drawn_card)
-                turn_data['discarded_value'] = drawn_card.get_value()
-
-                if player.call_cambio() and not self.cambio_called:
-                    self.cambio_called = True
-                    self.cambio_caller = self.current_player
-                    self.final_round_active = True
-                    turn_data['cambio_called'] = True
-                    if verbose:
-                        print(f"\n {player.name} called CAMBIO!")
+                turn_data['discarded_card'] = repr(drawn_card) if record_strings else drawn_card
+                turn_data['discarded_value'] = drawn_card.value
+
+                self._maybe_call_cambio(player, turn_data, verbose)
 
                 turn_data['hand_size'] = len(player.hand)
                 self._broadcast_and_stick(turn_data, verbose)
@@ -380,7 +581,8 @@ class CambioGame:
 
         action = player.choose_action(drawn_card)
 
-        if action['type'] == 'swap':
+        action_type = action['type']
+        if action_type == 'swap':
             pos = action.get('position', 0)
             turn_data['action'] = 'swap'
             turn_data['swap_position'] = pos
@@ -389,46 +591,53 @@ class CambioGame:
                 player.hand[pos] = drawn_card
                 self.discard.append(old_card)
                 player.known[pos] = drawn_card
-                turn_data['discarded_card'] = repr(old_card)
-                turn_data['discarded_value'] = old_card.get_value()
+                turn_data['discarded_card'] = repr(old_card) if record_strings else old_card
+                turn_data['discarded_value'] = old_card.value
                 if verbose:
                     print(f"{player.name} swapped position {pos}: {old_card} -> {drawn_card}")
             else:
                 self.discard.append(drawn_card)
-                turn_data['discarded_card'] = repr(drawn_card)
-                turn_data['discarded_value'] = drawn_card.get_value()
+                turn_data['discarded_card'] = repr(drawn_card) if record_strings else drawn_card
+                turn_data['discarded_value'] = drawn_card.value
                 if verbose:
                     print(f"{player.name} discarded (invalid position)")
 
-        elif action['type'] == 'discard':
+        elif action_type == 'discard':
             turn_data['action'] = 'discard'
             self.discard.append(drawn_card)
-            turn_data['discarded_card'] = repr(drawn_card)
-            turn_data['discarded_value'] = drawn_card.get_value()
+            turn_data['discarded_card'] = repr(drawn_card) if record_strings else drawn_card
+            turn_data['discarded_value'] = drawn_card.value
             if verbose:
                 print(f"{player.name} discarded {drawn_card}")
 
-        if player.call_cambio() and not self.cambio_called:
-            self.cambio_called = True
-            self.cambio_caller = self.current_player
-            self.final_round_active = True
-            turn_data['cambio_called'] = True
-            if verbose:
-                print(f"\n {player.name} called CAMBIO!")
+        self._maybe_call_cambio(player, turn_data, verbose)
 
         turn_data['hand_size'] = len(player.hand)
         self._broadcast_and_stick(turn_data, verbose)
         self.advance_turn()
         return turn_data
-    
+
+    def _maybe_call_cambio(self, player, turn_data, verbose):
+        """Ask the acting player whether to call Cambio (only if nobody has yet)."""
+        if self.cambio_called or not player.call_cambio():
+            return
+        self.cambio_called = True
+        self.cambio_caller = self.current_player
+        self.final_round_active = True
+        turn_data['cambio_called'] = True
+        if verbose:
+            print(f"\n {player.name} called CAMBIO!")
+
     def _broadcast_and_stick(self, turn_data, verbose):
         """Broadcast turn observation to all players, then offer stick opportunities."""
-        for p in self.players:
+        for p in self._turn_observers:
             p.observe_turn(turn_data, self)
         self._offer_stick_opportunities(verbose)
 
     def _offer_stick_opportunities(self, verbose):
         """Let the acting player attempt to stick cards matching the discard top."""
+        if not self._stickers[self.current_player]:
+            return
         player = self.players[self.current_player]
         positions = player.choose_stick(self)
         for pos in positions:
@@ -439,7 +648,7 @@ class CambioGame:
                     'position': pos,
                     'success': success,
                 }
-                for obs in self.players:
+                for obs in self._stick_observers:
                     obs.observe_stick(stick_data, self)
                 # Only one stick attempt per turn
                 break
@@ -453,19 +662,34 @@ class CambioGame:
     def game_over(self):
         return self.cambio_called and not self.final_round_active
     
-    def play(self, verbose=True, max_turns=50):
+    def play(self, verbose=True, max_turns=50, record_strings=False, keep_turns=True):
+        """Play until the game ends or *max_turns* is reached.
+
+        Card fields in the turn records and final hands are Card objects unless
+        *record_strings* is set; use cards_to_strings() to render them later.
+        With *keep_turns* off the per-turn records are dropped as soon as the
+        observers have seen them and ``turns`` comes back empty.
+        """
         turn = 0
         turns = []
-
-        while not self.game_over() and turn < max_turns:
-            turn_data = self.play_turn(turn_number=turn, verbose=verbose)
-            turns.append(turn_data)
+        play_turn = self.play_turn
+        record_turn = turns.append if keep_turns else None
+
+        # game_over() inlined; this loop drives every simulated game
+        while (not self.cambio_called or self.final_round_active) and turn < max_turns:
+            turn_data = play_turn(turn_number=turn, verbose=verbose, record_strings=record_strings)
+            if record_turn is not None:
+                record_turn(turn_data)
             turn += 1
 
-        scores = {p.name: self.calculate_score(p) for p in self.players}
-        hands = {p.name: [repr(c) for c in p.hand] for p in self.players}
+        players = self.players
+        scores = {p.name: self.calculate_score(p) for p in players}
+        if record_strings:
+            hands = {p.name: cards_to_strings(p.hand) for p in players}
+        else:
+            hands = {p.name: list(p.hand) for p in players}
         winner = min(scores, key=scores.get)
-        cambio_caller = self.players[self.cambio_caller].name if self.cambio_caller is not None else None
+        cambio_caller = players[self.cambio_caller].name if self.cambio_caller is not None else None
 
         if verbose:
             print("\n" + "=" * 50)
@@ -1,5 +1,6 @@
 """GUI for playing Cambio against an opponent."""
 import tkinter as tk
+from functools import lru_cache
 from tkinter import messagebox
 
 from game import CambioGame, Player
@@ -9,6 +10,13 @@ AGENT_REGISTRY = {
     'base': BaseAgent
 }
 
+_SUIT_SYMBOLS = {
+    "Hearts": "♥",
+    "Diamonds": "♦",
+    "Clubs": "♣",
+    "Spades": "♠",
+}
+
 """Not yet complete. Will hopefully have most actions and a agent to play against.
     It may or may not error. 
 Current state: Shows idea of what the cambio GUI may look like. 
@@ -52,44 +60,46 @@ class CambioGUI:
         self.player_frame = tk.Frame(self.root)
         self.player_frame.pack(pady=5)
 
-        self.log = tk.Text(self.root, height=6, width=45)
-        self.log.pack(pady=10)
-
-    def update_cards(self):
-        for w in self.player_frame.winfo_children():
-            w.destroy()
-        for w in self.opponent_frame.winfo_children():
-            w.destroy()
-
-        for i, card in enumerate(self.opponent_hand):
+        # Card buttons are created once; update_cards only changes their text
+        self.opponent_btns = []
+        for i in range(len(self.opponent_hand)):
             btn = tk.Button(self.opponent_frame,
-                            text=card,
+                            text="?",
                             font=("Arial",30),
                             command=lambda i=i: self.opponent_card_clicked(i))
             btn.pack(side="left", padx=10)
+            self.opponent_btns.append(btn)
 
-        for i, card in enumerate(self.p1.hand):
-            if i in self.p1.known:
-                text = self.card_to_text(card)
-            else:
-                text = "?"
-
+        self.player_btns = []
+        for i in range(len(self.p1.hand)):
             btn = tk.Button(self.player_frame,
-                            text=text,
+                            text="?",
                             font=("Arial",30),
                             command=lambda i=i: self.card_clicked(i))
             btn.pack(side="left", padx=10)
+            self.player_btns.append(btn)
+
+        self.log = tk.Text(self.root, height=6, width=45)
+        self.log.pack(pady=10)
+
+    def update_cards(self):
+        for btn, text in zip(self.opponent_btns, self.opponent_hand):
+            btn.config(text=text)
+
+        hand, known, fmt = self.p1.hand, self.p1.known, self.card_to_text
+        texts = [fmt(hand[i]) if i in known else "?" for i in range(len(hand))]
+        for btn, text in zip(self.player_btns, texts):
+            btn.config(text=text)
 
     def card_to_text(self, card):
-        if card.rank == "Joker":
+        return self._fmt(card.rank, card.suit)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _fmt(rank, suit):
+        if rank == "Joker":
             return "Joker"
-        suit_symbols = {
-            "Hearts": "♥",
-            "Diamonds": "♦",
-            "Clubs": "♣",
-            "Spades": "♠",
-        }
-        return f"{card.rank}{suit_symbols[card.suit]}"
+        return f"{rank}{_SUIT_SYMBOLS[suit]}"
 
     def card_clicked(self, index):
         self.selected_card_i = index
@@ -1,8 +1,14 @@
 """Simulation system for running Cambio matches and tournaments between agents."""
 
 import argparse
-import statistics
-from collections import defaultdict
+import math
+import os
+import random
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+import numpy as np
 
 from game import CambioGame
 from agents import BaseAgent, SmartAgent, BayesianAgent, BayesianV2Agent
@@ -32,142 +38,302 @@ def create_agent(agent_type, name, **kwargs):
 class Match:
     """Plays rounds until one player reaches *point_limit* (that player LOSES)."""
 
-    def __init__(self, agent_configs, point_limit=100, verbose=False):
+    def __init__(self, agent_configs, point_limit=100, verbose=False, keep_round_detail=False,
+                 rng=None):
         """
         agent_configs: list of dicts, e.g.
             [{'type': 'base', 'name': 'Base'}, {'type': 'smart', 'name': 'Smart'}]
+        keep_round_detail: keep every round's game result in 'round_results'
+            (needed by the per-round plots); otherwise only the match summary is returned.
+        rng: random.Random driving every shuffle and agent choice in the match;
+            defaults to the global random module.
         """
         self.agent_configs = agent_configs
         self.point_limit = point_limit
         self.verbose = verbose
+        self.keep_round_detail = keep_round_detail
+        self.rng = rng
+        self.names = [cfg['name'] for cfg in agent_configs]
 
-    def play(self):
-        cumulative_scores = {cfg['name']: 0 for cfg in self.agent_configs}
-        round_results = []
+    def iter_rounds(self):
+        """Play the match one round at a time, yielding each round's game result.
+
+        Running totals are kept in self.scores, parallel to self.names; the
+        generator stops after the round in which someone reaches the point limit.
+        """
+        names = self.names
+        self.scores = scores = [0] * len(names)
+        seats = range(len(names))
+        verbose = self.verbose
+        point_limit = self.point_limit
         rounds_played = 0
 
-        while True:
-            # Fresh agents each round
-            agents = [
-                create_agent(cfg['type'], cfg['name'], **cfg.get('kwargs', {}))
-                for cfg in self.agent_configs
-            ]
+        # One set of agents and one game per match, reset between rounds
+        agents = [
+            create_agent(cfg['type'], cfg['name'], **cfg.get('kwargs', {}))
+            for cfg in self.agent_configs
+        ]
+        game = CambioGame(agents, rng=self.rng)
 
-            game = CambioGame(agents)
+        while True:
+            if rounds_played:
+                game.reset()
             game.deal()
-            result = game.play(verbose=self.verbose)
+            result = game.play(verbose=verbose, keep_turns=False)
+
+            # Fold the round into the running totals and check the point limit in one pass
+            round_scores = result['scores']
+            limit_reached = False
+            for i in seats:
+                total = scores[i] + round_scores[names[i]]
+                scores[i] = total
+                if total >= point_limit:
+                    limit_reached = True
+            rounds_played += 1
 
-            for name, score in result['scores'].items():
-                cumulative_scores[name] += score
+            if verbose:
+                print(f"  [Round {rounds_played}] Scores: {dict(zip(names, scores))}")
 
-            round_results.append(result)
-            rounds_played += 1
+            yield result
 
-            if self.verbose:
-                print(f"  [Round {rounds_played}] Scores: {cumulative_scores}")
+            # Anyone at the point limit loses, which ends the match
+            if limit_reached:
+                return
 
-            # Check if anyone has reached the point limit (they lose)
-            losers = [n for n, s in cumulative_scores.items() if s >= self.point_limit]
-            if losers:
-                loser = max(losers, key=lambda n: cumulative_scores[n])
-                winner = min(cumulative_scores, key=cumulative_scores.get)
-                return {
-                    'winner': winner,
-                    'loser': loser,
-                    'final_scores': dict(cumulative_scores),
-                    'rounds_played': rounds_played,
-                    'round_results': round_results,
-                }
+    def play(self):
+        round_results = []
+        rounds_played = 0
+        for result in self.iter_rounds():
+            rounds_played += 1
+            if self.keep_round_detail:
+                round_results.append(result)
+
+        names, scores = self.names, self.scores
+        match_result = {
+            'winner': names[min(range(len(scores)), key=scores.__getitem__)],
+            'loser': names[max(range(len(scores)), key=scores.__getitem__)],
+            'final_scores': dict(zip(names, scores)),
+            'rounds_played': rounds_played,
+        }
+        if self.keep_round_detail:
+            match_result['round_results'] = round_results
+        return match_result
 
 
 # ---------------------------------------------------------------------------
 # Tournament — run M matches
 # ---------------------------------------------------------------------------
 
+def _run_one_match(args):
+    """Play one Match from an (agent_configs, point_limit, verbose, keep_round_detail, seed) tuple."""
+    agent_configs, point_limit, verbose, keep_round_detail, seed = args
+    rng = random.Random(seed) if seed is not None else None
+    return Match(agent_configs, point_limit=point_limit, verbose=verbose,
+                 keep_round_detail=keep_round_detail, rng=rng).play()
+
+
+# Read-only tournament settings, set once per worker process by _init_worker
+_WORKER_STATE = {}
+
+
+def _init_worker(agent_configs, point_limit, keep_round_detail, base_seed):
+    # Forked workers inherit the parent's random state; reseed so they don't replay the same games
+    random.seed()
+    _WORKER_STATE.update(agent_configs=agent_configs, point_limit=point_limit,
+                         keep_round_detail=keep_round_detail, base_seed=base_seed)
+
+
+def _run_match_idx(i):
+    """Worker entry point: play match *i* using the settings stashed by _init_worker."""
+    state = _WORKER_STATE
+    base_seed = state['base_seed']
+    seed = base_seed + i if base_seed is not None else None
+    # Interleaved per-turn output from several processes is unreadable, so workers run quiet
+    return _run_one_match((state['agent_configs'], state['point_limit'], False,
+                           state['keep_round_detail'], seed))
+
+
+class _ScoreAccumulator:
+    """One-pass mean/stdev/min/max for integer scores, fed as match results arrive.
+
+    Scores are small integers, so the median comes from a count per distinct
+    score instead of the full list; *keep_values* also holds on to the raw
+    values, in arrival order, for callers that want to plot them.
+    """
+
+    def __init__(self, keep_values=False):
+        self.n = 0
+        self.sum_x = 0
+        self.sum_x2 = 0
+        self.min_x = None
+        self.max_x = None
+        self.counts = Counter()
+        self.values = [] if keep_values else None
+
+    def add(self, x):
+        self.n += 1
+        self.sum_x += x
+        self.sum_x2 += x * x
+        if self.min_x is None or x < self.min_x:
+            self.min_x = x
+        if self.max_x is None or x > self.max_x:
+            self.max_x = x
+        self.counts[x] += 1
+        if self.values is not None:
+            self.values.append(x)
+
+    def mean(self):
+        return self.sum_x / self.n
+
+    def median(self):
+        # Walk the sorted distinct scores to the middle one (or two, for even n)
+        lo_rank, hi_rank = (self.n - 1) // 2, self.n // 2
+        lo = hi = None
+        seen = 0
+        for x in sorted(self.counts):
+            seen += self.counts[x]
+            if lo is None and seen > lo_rank:
+                lo = x
+            if seen > hi_rank:
+                hi = x
+                break
+        return (lo + hi) / 2
+
+    def stdev(self):
+        if self.n < 2:
+            return 0
+        # Exact integer arithmetic until the final sqrt, so no cancellation error
+        return math.sqrt((self.n * self.sum_x2 - self.sum_x ** 2) / (self.n * (self.n - 1)))
+
+    def summary(self):
+        dist = {
+            'mean': self.mean(),
+            'median': self.median(),
+            'stdev': self.stdev(),
+            'min': self.min_x,
+            'max': self.max_x,
+        }
+        if self.values is not None:
+            dist['values'] = self.values
+        return dist
+
+
 class Tournament:
-    """Runs *num_matches* Match instances and aggregates stats."""
+    """Runs *num_matches* Match instances and aggregates stats.
+
+    workers: number of processes to spread matches over. 1 (the default) plays
+    them in this process, which is what verbose output and debugging need
+    (verbose is ignored with more than one worker); None uses every core.
+    Matches are handed to workers in chunks so short matches don't pay one
+    round-trip of pickling each.
+
+    keep_round_detail: forwarded to each Match; off by default so results (and
+    worker payloads) grow with the number of matches, not matches x rounds.
+
+    base_seed: if set, match i runs on random.Random(base_seed + i), so results
+    are reproducible and independent of how matches are spread over workers.
+
+    keep_values: include every final score in each 'score_distributions' entry
+    (as 'values'). Off by default; the summary stats are accumulated as
+    results come in and don't need the full lists.
 
-    def __init__(self, agent_configs, num_matches=10, point_limit=100, verbose=False):
+    collect_match_results: also return every match's result dict in
+    'match_results'. Off by default, so only the summary is kept and memory
+    doesn't grow with num_matches.
+    """
+
+    def __init__(self, agent_configs, num_matches=10, point_limit=100, verbose=False, workers=1,
+                 keep_round_detail=False, base_seed=None, keep_values=False,
+                 collect_match_results=False):
         self.agent_configs = agent_configs
         self.num_matches = num_matches
         self.point_limit = point_limit
-        self.verbose = verbose
+        self.keep_round_detail = keep_round_detail
+        self.base_seed = base_seed
+        self.keep_values = keep_values
+        self.collect_match_results = collect_match_results
+        self.workers = workers if workers is not None else os.cpu_count()
+        # Output from several processes would interleave, so verbose only applies sequentially
+        self.verbose = verbose and self.workers <= 1
+
+    def _match_seed(self, i):
+        return self.base_seed + i if self.base_seed is not None else None
+
+    def _play_matches(self):
+        """Yield match results in match order as they complete."""
+        if self.workers <= 1:
+            for i in range(self.num_matches):
+                if self.verbose:
+                    print(f"\n{'='*40} Match {i+1}/{self.num_matches} {'='*40}")
+                yield _run_one_match(
+                    (self.agent_configs, self.point_limit, self.verbose, self.keep_round_detail,
+                     self._match_seed(i)))
+            return
+
+        # Configs go to each worker once via the initializer; tasks are just match indices
+        chunksize = max(1, self.num_matches // (4 * self.workers))
+        initargs = (self.agent_configs, self.point_limit, self.keep_round_detail, self.base_seed)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=initargs) as ex:
+            yield from ex.map(_run_match_idx, range(self.num_matches), chunksize=chunksize)
 
     def play(self):
-        match_results = []
+        names = [cfg['name'] for cfg in self.agent_configs]
+        # Pulls every agent's final score out of a result in the fixed names order
+        get_scores = itemgetter(*names)
         win_counts = defaultdict(int)
-        final_scores_by_name = defaultdict(list)
-        rounds_list = []
-
-        for i in range(self.num_matches):
-            if self.verbose:
-                print(f"\n{'='*40} Match {i+1}/{self.num_matches} {'='*40}")
-
-            match = Match(
-                self.agent_configs,
-                point_limit=self.point_limit,
-                verbose=self.verbose,
-            )
-            result = match.play()
-            match_results.append(result)
+        score_stats = [_ScoreAccumulator(self.keep_values) for _ in names]
+        rounds_stats = _ScoreAccumulator(keep_values=True)
 
+        match_results = []
+        for result in self._play_matches():
+            if self.collect_match_results:
+                match_results.append(result)
             win_counts[result['winner']] += 1
-            rounds_list.append(result['rounds_played'])
-            for name, score in result['final_scores'].items():
-                final_scores_by_name[name].append(score)
+            rounds_stats.add(result['rounds_played'])
+            for stats, score in zip(score_stats, get_scores(result['final_scores'])):
+                stats.add(score)
 
-        names = [cfg['name'] for cfg in self.agent_configs]
         win_rates = {n: win_counts[n] / self.num_matches for n in names}
 
         summary = {
             'win_counts': dict(win_counts),
             'win_rates': win_rates,
-            'avg_rounds': statistics.mean(rounds_list),
-            'median_rounds': statistics.median(rounds_list),
-            'score_distributions': {
-                n: {
-                    'mean': statistics.mean(final_scores_by_name[n]),
-                    'median': statistics.median(final_scores_by_name[n]),
-                    'stdev': statistics.stdev(final_scores_by_name[n]) if len(final_scores_by_name[n]) > 1 else 0,
-                    'min': min(final_scores_by_name[n]),
-                    'max': max(final_scores_by_name[n]),
-                    'values': final_scores_by_name[n],
-                }
-                for n in names
-            },
-            'rounds_per_match': rounds_list,
+            'avg_rounds': rounds_stats.mean(),
+            'median_rounds': rounds_stats.median(),
+            'score_distributions': {n: stats.summary() for n, stats in zip(names, score_stats)},
+            'rounds_per_match': rounds_stats.values,
         }
 
-        return {
-            'match_results': match_results,
-            'summary': summary,
-        }
+        tournament_result = {'summary': summary}
+        if self.collect_match_results:
+            tournament_result['match_results'] = match_results
+        return tournament_result
 
 
 # ---------------------------------------------------------------------------
 # Visualization
 # ---------------------------------------------------------------------------
 
-def _import_matplotlib():
-    import matplotlib.pyplot as plt
-    return plt
+# Each helper takes the matplotlib.pyplot module from the caller, which imports it once.
 
+def _round_score_matrix(match_result):
+    """Player names and a (rounds, players) array of each round's scores."""
+    round_results = match_result['round_results']
+    names = list(round_results[0]['scores'].keys())
+    scores = np.array([[rnd['scores'][n] for n in names] for rnd in round_results])
+    return names, scores
 
-def plot_score_progression(match_result, title=None):
-    """Cumulative score line chart for a single match."""
-    plt = _import_matplotlib()
-    names = list(match_result['round_results'][0]['scores'].keys())
-    cumulative = {n: [] for n in names}
-    running = {n: 0 for n in names}
 
-    for rnd in match_result['round_results']:
-        for n in names:
-            running[n] += rnd['scores'][n]
-            cumulative[n].append(running[n])
+def plot_score_progression(match_result, plt, title=None):
+    """Cumulative score line chart for a single match."""
+    names, round_scores = _round_score_matrix(match_result)
+    cumulative = np.cumsum(round_scores, axis=0)
+    rounds = np.arange(1, len(cumulative) + 1)
 
     fig, ax = plt.subplots()
-    for n in names:
-        ax.plot(range(1, len(cumulative[n]) + 1), cumulative[n], marker='o', label=n)
+    for i, n in enumerate(names):
+        ax.plot(rounds, cumulative[:, i], marker='o', label=n)
     ax.set_xlabel('Round')
     ax.set_ylabel('Cumulative Score')
     ax.set_title(title or 'Score Progression')
@@ -176,9 +342,8 @@ def plot_score_progression(match_result, title=None):
     return fig
 
 
-def plot_win_rates(tournament_result):
+def plot_win_rates(tournament_result, plt):
     """Bar chart of win rates."""
-    plt = _import_matplotlib()
     summary = tournament_result['summary']
     names = list(summary['win_rates'].keys())
     rates = [summary['win_rates'][n] for n in names]
@@ -194,25 +359,34 @@ def plot_win_rates(tournament_result):
     return fig
 
 
-def plot_score_distributions(tournament_result):
-    """Histograms + box plots of final scores."""
-    plt = _import_matplotlib()
-    summary = tournament_result['summary']
-    names = list(summary['score_distributions'].keys())
+def plot_score_distributions(tournament_result, plt):
+    """Histograms + box plots of final scores.
+
+    Needs every final score, so the Tournament must be built with keep_values=True.
+    """
+    distributions = tournament_result['summary']['score_distributions']
+    names = list(distributions.keys())
+    if any('values' not in distributions[n] for n in names):
+        raise ValueError("plot_score_distributions needs the raw scores; "
+                         "run the Tournament with keep_values=True")
 
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
 
-    # Histograms
-    for n in names:
-        axes[0].hist(summary['score_distributions'][n]['values'],
-                     alpha=0.6, label=n, bins=15)
+    data = [distributions[n]['values'] for n in names]
+
+    # Histograms over one set of bins shared by every agent
+    bins = np.histogram_bin_edges(np.concatenate(data), bins=15)
+    centers = (bins[:-1] + bins[1:]) / 2
+    widths = np.diff(bins)
+    for n, values in zip(names, data):
+        counts, _ = np.histogram(values, bins=bins)
+        axes[0].bar(centers, counts, width=widths, alpha=0.6, label=n)
     axes[0].set_xlabel('Final Score')
     axes[0].set_ylabel('Frequency')
     axes[0].set_title('Final Score Distribution')
     axes[0].legend()
 
     # Box plots
-    data = [summary['score_distributions'][n]['values'] for n in names]
     axes[1].boxplot(data, labels=names)
     axes[1].set_ylabel('Final Score')
     axes[1].set_title('Final Score Box Plot')
@@ -221,9 +395,8 @@ def plot_score_distributions(tournament_result):
     return fig
 
 
-def plot_rounds_per_match(tournament_result):
+def plot_rounds_per_match(tournament_result, plt):
     """Match length distribution."""
-    plt = _import_matplotlib()
     rounds = tournament_result['summary']['rounds_per_match']
 
     fig, ax = plt.subplots()
@@ -231,23 +404,21 @@ def plot_rounds_per_match(tournament_result):
     ax.set_xlabel('Rounds per Match')
     ax.set_ylabel('Frequency')
     ax.set_title('Match Length Distribution')
-    ax.axvline(statistics.mean(rounds), color='red', linestyle='--',
-               label=f'Mean: {statistics.mean(rounds):.1f}')
+    mean_rounds = tournament_result['summary']['avg_rounds']
+    ax.axvline(mean_rounds, color='red', linestyle='--',
+               label=f'Mean: {mean_rounds:.1f}')
     ax.legend()
     return fig
 
 
-def plot_round_score_deltas(match_result):
+def plot_round_score_deltas(match_result, plt):
     """Per-round score earned for each player (useful for RL reward shaping)."""
-    plt = _import_matplotlib()
-    names = list(match_result['round_results'][0]['scores'].keys())
+    names, round_scores = _round_score_matrix(match_result)
 
     fig, ax = plt.subplots()
-    x = range(1, len(match_result['round_results']) + 1)
-    for n in names:
-        deltas = [rnd['scores'][n] for rnd in match_result['round_results']]
-        ax.bar([xi + 0.2 * names.index(n) for xi in x], deltas,
-               width=0.2, label=n, alpha=0.8)
+    x = np.arange(1, len(round_scores) + 1)
+    for i, n in enumerate(names):
+        ax.bar(x + 0.2 * i, round_scores[:, i], width=0.2, label=n, alpha=0.8)
     ax.set_xlabel('Round')
     ax.set_ylabel('Score Earned')
     ax.set_title('Per-Round Score Deltas')
@@ -263,10 +434,22 @@ def main():
     parser = argparse.ArgumentParser(description='Cambio Agent Simulation')
     parser.add_argument('--matches', type=int, default=20, help='Number of matches in tournament')
     parser.add_argument('--point-limit', type=int, default=100, help='Point limit per match')
-    parser.add_argument('--verbose', action='store_true', help='Print every turn')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print every turn; only applies to single-process runs, '
+                             'so tournament matches stay quiet unless --workers is 1')
     parser.add_argument('--no-charts', action='store_true', help='Skip matplotlib charts')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes to run tournament matches on (0 = all cores)')
+    parser.add_argument('--seed', type=int, default=None, help='Base seed for reproducible tournaments')
     args = parser.parse_args()
 
+    plt = None
+    if not args.no_charts:
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            print("matplotlib not installed — skipping charts.")
+
     agent_configs = [
         {'type': 'base', 'name': 'BaseAgent'},
         {'type': 'smart', 'name': 'SmartAgent'},
@@ -276,7 +459,8 @@ def main():
     print("=" * 60)
     print("DEMO MATCH  (first to", args.point_limit, "loses)")
     print("=" * 60)
-    demo = Match(agent_configs, point_limit=args.point_limit, verbose=args.verbose)
+    demo = Match(agent_configs, point_limit=args.point_limit, verbose=args.verbose,
+                 keep_round_detail=True)
     demo_result = demo.play()
     print(f"\nWinner: {demo_result['winner']}")
     print(f"Final scores: {demo_result['final_scores']}")
@@ -291,6 +475,9 @@ def main():
         num_matches=args.matches,
         point_limit=args.point_limit,
         verbose=args.verbose,
+        workers=args.workers or None,
+        base_seed=args.seed,
+        keep_values=True,
     )
     tourney_result = tourney.play()
     s = tourney_result['summary']
@@ -303,17 +490,13 @@ def main():
               f"stdev={dist['stdev']:.1f}  range=[{dist['min']}, {dist['max']}]")
 
     # --- Charts ---
-    if not args.no_charts:
-        try:
-            plt = _import_matplotlib()
-            plot_score_progression(demo_result, title='Demo Match Score Progression')
-            plot_win_rates(tourney_result)
-            plot_score_distributions(tourney_result)
-            plot_rounds_per_match(tourney_result)
-            plot_round_score_deltas(demo_result)
-            plt.show()
-        except ImportError:
-            print("\nmatplotlib not installed — skipping charts.")
+    if plt is not None:
+        plot_score_progression(demo_result, plt, title='Demo Match Score Progression')
+        plot_win_rates(tourney_result, plt)
+        plot_score_distributions(tourney_result, plt)
+        plot_rounds_per_match(tourney_result, plt)
+        plot_round_score_deltas(demo_result, plt)
+        plt.show()
 
 
 if __name__ == '__main__':
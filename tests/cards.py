@@ -0,0 +1,7 @@
+"""Power cards shared by the agent tests; the interned Card instances."""
+
+from game import Card
+
+JACK_OF_HEARTS = Card.get('J', 'Hearts')
+QUEEN_OF_HEARTS = Card.get('Q', 'Hearts')
+KING_OF_SPADES = Card.get('K', 'Spades')
@@ -0,0 +1,27 @@
+"""Shared pytest setup: make the repo root importable once per session, and
+keep tests marked ``slow`` out of the default run (``--runslow`` includes them)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="also run tests marked slow (multi-game integration)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: multi-game integration, skipped unless --runslow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to include")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
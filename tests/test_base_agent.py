@@ -1,10 +1,5 @@
 """Tests for BaseAgent."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import pytest
 from agents.base_agent import BaseAgent
 from game import Card, CambioGame, Player
@@ -26,64 +21,51 @@ class MockGame:
         self.discard = discard or []
 
 
-class TestChooseDraw:
-    def test_draws_from_deck_by_default(self):
-        agent = BaseAgent()
-        game = MockGame()
-        assert agent.choose_draw(game) == 'deck'
-
-    def test_draws_low_card_from_discard(self):
-        agent = BaseAgent()
-        game = MockGame([Card('2', 'Hearts')])  # Value 2 < 4
-        assert agent.choose_draw(game) == 'discard'
-
-    def test_draws_from_deck_for_high_discard(self):
-        agent = BaseAgent()
-        game = MockGame([Card('K', 'Spades')])
-        assert agent.choose_draw(game) == 'deck'
-
-    def test_draws_from_deck_for_4(self):
-        agent = BaseAgent()
-        game = MockGame([Card('4', 'Hearts')])  # Value 4 is not < 4
-        assert agent.choose_draw(game) == 'deck'
+CHOOSE_DRAW_CASES = [
+    # (discard top or None for an empty pile, expected source)
+    pytest.param(None, 'deck', id='deck_by_default'),
+    pytest.param(Card.get('2', 'Hearts'), 'discard', id='takes_low_card'),  # Value 2 < 4
+    pytest.param(Card.get('K', 'Spades'), 'deck', id='skips_high_card'),
+    pytest.param(Card.get('4', 'Hearts'), 'deck', id='skips_4'),  # Value 4 is not < 4
+    pytest.param(Card.get('A', 'Hearts'), 'discard', id='takes_ace'),  # Value 1 < 4
+    pytest.param(Card.get('3', 'Hearts'), 'discard', id='takes_3'),  # Value 3 < 4
+]
 
-    def test_draws_ace_from_discard(self):
-        agent = BaseAgent()
-        game = MockGame([Card('A', 'Hearts')])  # Value 1 < 4
-        assert agent.choose_draw(game) == 'discard'
 
-    def test_draws_3_from_discard(self):
+class TestChooseDraw:
+    @pytest.mark.parametrize("discard_card, expected", CHOOSE_DRAW_CASES)
+    def test_choose_draw(self, discard_card, expected):
         agent = BaseAgent()
-        game = MockGame([Card('3', 'Hearts')])  # Value 3 < 4
-        assert agent.choose_draw(game) == 'discard'
+        game = MockGame([discard_card] if discard_card is not None else None)
+        assert agent.choose_draw(game) == expected
 
 
 class TestChooseAction:
     def test_discards_high_card_with_low_hand(self):
         agent = BaseAgent()
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Hearts'), Card('3', 'Hearts'), Card('4', 'Hearts')]
+        agent.hand = [Card.get('A', 'Hearts'), Card.get('2', 'Hearts'), Card.get('3', 'Hearts'), Card.get('4', 'Hearts')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}
 
-        drawn = Card('K', 'Spades')  # Value 10
+        drawn = Card.get('K', 'Spades')  # Value 10
         action = agent.choose_action(drawn)
         assert action['type'] == 'discard'
 
     def test_swaps_with_known_high_card(self):
         agent = BaseAgent()
-        agent.hand = [Card('K', 'Spades'), Card('Q', 'Hearts'), Card('3', 'Hearts'), Card('4', 'Hearts')]
+        agent.hand = [Card.get('K', 'Spades'), Card.get('Q', 'Hearts'), Card.get('3', 'Hearts'), Card.get('4', 'Hearts')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}
 
-        drawn = Card('2', 'Hearts')  # Value 2
+        drawn = Card.get('2', 'Hearts')  # Value 2
         action = agent.choose_action(drawn)
         assert action['type'] == 'swap'
         assert action['position'] in [0, 1]  # Should swap with K or Q
 
     def test_swaps_with_worst_card(self):
         agent = BaseAgent()
-        agent.hand = [Card('K', 'Spades'), Card('5', 'Hearts'), Card('3', 'Hearts'), Card('4', 'Hearts')]
+        agent.hand = [Card.get('K', 'Spades'), Card.get('5', 'Hearts'), Card.get('3', 'Hearts'), Card.get('4', 'Hearts')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}  # K=10, 5=5
 
-        drawn = Card('2', 'Hearts')
+        drawn = Card.get('2', 'Hearts')
         action = agent.choose_action(drawn)
         assert action['type'] == 'swap'
         assert action['position'] == 0  # K is worst (10 > 5)
@@ -98,10 +80,10 @@ class TestCallCambio:
 class TestPowerActions:
     def test_peek_own_unknown(self):
         agent = BaseAgent()
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Hearts'), Card('3', 'Hearts'), Card('4', 'Hearts')]
+        agent.hand = [Card.get('A', 'Hearts'), Card.get('2', 'Hearts'), Card.get('3', 'Hearts'), Card.get('4', 'Hearts')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}
 
-        card = Card('7', 'Hearts')
+        card = Card.get('7', 'Hearts')
         action = agent.choose_power_action(card, None, [])
 
         assert action is not None
@@ -110,10 +92,10 @@ class TestPowerActions:
 
     def test_skip_peek_when_all_known(self):
         agent = BaseAgent()
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Hearts'), Card('3', 'Hearts'), Card('4', 'Hearts')]
+        agent.hand = [Card.get('A', 'Hearts'), Card.get('2', 'Hearts'), Card.get('3', 'Hearts'), Card.get('4', 'Hearts')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
 
-        card = Card('7', 'Hearts')
+        card = Card.get('7', 'Hearts')
         action = agent.choose_power_action(card, None, [])
 
         assert action is None  # No unknown cards to peek
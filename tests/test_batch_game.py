@@ -0,0 +1,61 @@
+"""Tests for the vectorized BatchCambio simulator."""
+
+import numpy as np
+from game import Deck
+from batch_game import BatchCambio, DECK_CODES, VALUES, HAND_SIZE
+
+
+class TestDeckCodes:
+    def test_matches_deck_values(self):
+        deck = Deck()
+        assert sorted(VALUES[DECK_CODES].tolist()) == sorted(c.get_value() for c in deck.cards)
+
+
+class TestDealBatch:
+    def test_every_deck_is_a_permutation(self):
+        sim = BatchCambio(rng=np.random.default_rng(0))
+        sim.deal_batch(20)
+        expected = np.sort(DECK_CODES)
+        for deck in sim.decks:
+            assert np.array_equal(np.sort(deck), expected)
+
+    def test_initial_state(self):
+        sim = BatchCambio(num_players=3, rng=np.random.default_rng(1))
+        sim.deal_batch(5)
+        assert sim.hands.shape == (5, 3, HAND_SIZE)
+        assert sim.known[:, :, :2].all()
+        assert not sim.known[:, :, 2:].any()
+        assert (sim.top_ptr == 3 * HAND_SIZE + 1).all()
+
+
+class TestPlay:
+    def test_no_card_duplicated(self):
+        """Hands plus discard top are always a sub-multiset of the full deck."""
+        sim = BatchCambio(rng=np.random.default_rng(2))
+        sim.play(50, max_turns=30)
+        for i in range(50):
+            held = np.concatenate([sim.hands[i].ravel(), [sim.discard_top[i]]])
+            remaining = DECK_CODES.tolist()
+            for code in held.tolist():
+                remaining.remove(code)
+
+    def test_scores_and_winners(self):
+        sim = BatchCambio(rng=np.random.default_rng(3))
+        result = sim.play(100)
+        assert result['scores'].shape == (100, 2)
+        assert np.array_equal(result['scores'], VALUES[sim.hands].sum(axis=2))
+        assert np.array_equal(result['winners'], result['scores'].argmin(axis=1))
+
+    def test_known_cards_never_get_worse(self):
+        """A BaseAgent-style policy only swaps downwards, so the max known value can't rise."""
+        sim = BatchCambio(rng=np.random.default_rng(4))
+        sim.deal_batch(200)
+        before = np.where(sim.known[:, 0, :2], VALUES[sim.hands[:, 0, :2]], -2).max(axis=1)
+        sim.step()
+        after = np.where(sim.known[:, 0, :2], VALUES[sim.hands[:, 0, :2]], -2).max(axis=1)
+        assert (after <= before).all()
+
+    def test_seeded_runs_are_reproducible(self):
+        a = BatchCambio(rng=np.random.default_rng(5)).play(10)
+        b = BatchCambio(rng=np.random.default_rng(5)).play(10)
+        assert np.array_equal(a['scores'], b['scores'])
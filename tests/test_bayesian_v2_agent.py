@@ -1,42 +1,57 @@
 """Tests for BayesianV2Agent."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import random
 
 import pytest
 from game import Card, CambioGame, Player
 from agents.bayesian_v2_agent import BayesianV2Agent
 from agents.bayesian_agent import BayesianAgent
 from agents.smart_agent import SmartAgent
+from tests.cards import JACK_OF_HEARTS, QUEEN_OF_HEARTS, KING_OF_SPADES
+
+
+BLACK_KING_HAND = [Card.get('A', 'Hearts'), KING_OF_SPADES, Card.get('3', 'Clubs'), Card.get('A', 'Diamonds')]
 
 
 def make_game(agent, *opponents):
-    """Create a game with the given players and deal."""
+    """Create a game with the given players and deal.
+
+    The deck is dealt in its fixed unshuffled order, so the unit tests below don't
+    depend on the RNG.
+    """
     players = [agent] + list(opponents)
     game = CambioGame(players)
-    game.deal()
+    game.deal(shuffle=False)
     return game
 
 
+@pytest.fixture
+def v2_vs_smart():
+    """(agent, opp): a fresh V2 agent and one SmartAgent."""
+    return BayesianV2Agent("V2"), SmartAgent("Opp")
+
+
+@pytest.fixture
+def v2_vs_two_smart():
+    """(agent, opp1, opp2): a fresh V2 agent and two SmartAgents."""
+    return BayesianV2Agent("V2"), SmartAgent("Opp1"), SmartAgent("Opp2")
+
+
 # ------------------------------------------------------------------
 # Opponent self-knowledge tracking
 # ------------------------------------------------------------------
 
 class TestOpponentSelfKnowledge:
-    def test_initialized_with_positions_0_1(self):
-        agent = BayesianV2Agent("V2")
-        opp = SmartAgent("Opp")
+    def test_initialized_with_positions_0_1(self, v2_vs_smart):
+        agent, opp = v2_vs_smart
         game = make_game(agent, opp)
         agent._ensure_initialized(game)
 
         knowledge = agent.tracker.get_opponent_self_knowledge("Opp")
         assert knowledge == {0, 1}
 
-    def test_draw_swap_gains_knowledge(self):
-        agent = BayesianV2Agent("V2")
-        opp = SmartAgent("Opp")
+    def test_draw_swap_gains_knowledge(self, v2_vs_smart):
+        agent, opp = v2_vs_smart
         game = make_game(agent, opp)
         agent._ensure_initialized(game)
 
@@ -56,16 +71,14 @@ class TestOpponentSelfKnowledge:
             'discarded_value': 5,
             'hand_size': 4,
         }
-        game.discard.append(Card('5', 'Hearts'))
+        game.discard.append(Card.get('5', 'Hearts'))
         agent.observe_turn(turn_data, game)
 
         knowledge = agent.tracker.get_opponent_self_knowledge("Opp")
         assert 2 in knowledge
 
-    def test_blind_swap_loses_knowledge(self):
-        agent = BayesianV2Agent("V2")
-        opp1 = SmartAgent("Opp1")
-        opp2 = SmartAgent("Opp2")
+    def test_blind_swap_loses_knowledge(self, v2_vs_two_smart):
+        agent, opp1, opp2 = v2_vs_two_smart
         game = make_game(agent, opp1, opp2)
         agent._ensure_initialized(game)
 
@@ -86,17 +99,15 @@ class TestOpponentSelfKnowledge:
             'discarded_value': 10,
             'hand_size': 4,
         }
-        game.discard.append(Card('J', 'Hearts'))
+        game.discard.append(JACK_OF_HEARTS)
         agent.observe_turn(turn_data, game)
 
         # Opp1 loses knowledge of pos 0, Opp2 loses knowledge of pos 1
         assert 0 not in agent.tracker.get_opponent_self_knowledge("Opp1")
         assert 1 not in agent.tracker.get_opponent_self_knowledge("Opp2")
 
-    def test_third_party_swap_loses_knowledge(self):
-        agent = BayesianV2Agent("V2")
-        opp1 = SmartAgent("Opp1")
-        opp2 = SmartAgent("Opp2")
+    def test_third_party_swap_loses_knowledge(self, v2_vs_two_smart):
+        agent, opp1, opp2 = v2_vs_two_smart
         game = make_game(agent, opp1, opp2)
         agent._ensure_initialized(game)
 
@@ -116,7 +127,7 @@ class TestOpponentSelfKnowledge:
             'discarded_value': 10,
             'hand_size': 4,
         }
-        game.discard.append(Card('Q', 'Hearts'))
+        game.discard.append(QUEEN_OF_HEARTS)
         # This won't update because acting == self.name, so observe_turn skips
         # the opponent tracking. Let's simulate as if another V2 agent did it.
         turn_data['player'] = 'Opp1'  # pretend Opp1 initiated
@@ -142,7 +153,7 @@ class TestThirdPartySwapEngine:
         p2_card = p2.hand[1]
         p3_card = p3.hand[2]
 
-        card = Card('J', 'Hearts')
+        card = JACK_OF_HEARTS
         result = p1.use_card_power(card, game, opponent=p2, opp_pos=1,
                                    player2=p3, pos2=2, verbose=False)
         assert result is True
@@ -160,7 +171,7 @@ class TestThirdPartySwapEngine:
         p2_card = p2.hand[0]
         p3_card = p3.hand[1]
 
-        card = Card('K', 'Spades')
+        card = KING_OF_SPADES
         result = p1.use_card_power(card, game, opponent=p2, opp_pos=0,
                                    player2=p3, pos2=1,
                                    peek_player=p2, peek_pos=0, verbose=False)
@@ -174,18 +185,14 @@ class TestThirdPartySwapEngine:
 # ------------------------------------------------------------------
 
 class TestDisruptionSwapTargeting:
-    def test_prefers_known_opponent_position(self):
+    def test_prefers_known_opponent_position(self, v2_vs_smart):
         """_find_best_swap_target should prefer positions the opponent knows."""
-        agent = BayesianV2Agent("V2")
-        opp = SmartAgent("Opp")
+        agent, opp = v2_vs_smart
         game = make_game(agent, opp)
         agent._ensure_initialized(game)
 
         # Give agent a bad card to trigger swap
-        agent.hand = [Card('A', 'Hearts'), Card('K', 'Spades'), Card('3', 'Clubs'), Card('A', 'Diamonds')]
-        agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
-        for pos, card in agent.known.items():
-            agent.tracker.set_own_card(pos, (card.rank, card.suit))
+        agent.set_full_known(list(BLACK_KING_HAND))
 
         # Set two known opponent cards with same value
         agent.tracker.set_opponent_card('Opp', 0, ('2', 'Hearts'))
@@ -198,11 +205,9 @@ class TestDisruptionSwapTargeting:
         _, pos = result
         assert pos == 0  # The one the opponent knows
 
-    def test_find_best_disruption_swap(self):
+    def test_find_best_disruption_swap(self, v2_vs_two_smart):
         """Should find two opponent positions from different opponents to swap."""
-        agent = BayesianV2Agent("V2")
-        opp1 = SmartAgent("Opp1")
-        opp2 = SmartAgent("Opp2")
+        agent, opp1, opp2 = v2_vs_two_smart
         game = make_game(agent, opp1, opp2)
         agent._ensure_initialized(game)
 
@@ -221,27 +226,24 @@ class TestDisruptionSwapTargeting:
 # ------------------------------------------------------------------
 
 class TestBlackKingSelfPeek:
-    def test_disruption_mode_prefers_self_peek(self):
+    def test_disruption_mode_prefers_self_peek(self, v2_vs_two_smart):
         """With unknown own positions, Black King disruption should peek self first."""
-        agent = BayesianV2Agent("V2")
-        opp1 = SmartAgent("Opp1")
-        opp2 = SmartAgent("Opp2")
+        agent, opp1, opp2 = v2_vs_two_smart
         game = make_game(agent, opp1, opp2)
         agent._ensure_initialized(game)
 
         # Good hand but positions 2,3 are unknown
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Spades'), Card('3', 'Clubs'), Card('A', 'Diamonds')]
+        agent.hand = [Card.get('A', 'Hearts'), Card.get('2', 'Spades'), Card.get('3', 'Clubs'), Card.get('A', 'Diamonds')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}
-        agent.tracker.set_own_card(0, ('A', 'Hearts'))
-        agent.tracker.set_own_card(1, ('2', 'Spades'))
-        agent.tracker.own_hand[2] = None
-        agent.tracker.own_hand[3] = None
+        agent.tracker.set_own_cards(agent.known)
+        agent.tracker.own_card_swapped_out(2)
+        agent.tracker.own_card_swapped_out(3)
 
         # Both opponents have known positions for disruption
         agent.tracker.set_opponent_card('Opp1', 0, ('5', 'Hearts'))
         agent.tracker.set_opponent_card('Opp2', 0, ('4', 'Clubs'))
 
-        card = Card('K', 'Spades')
+        card = KING_OF_SPADES
         result = agent.choose_power_action(card, game, [opp1, opp2])
         assert result is not None
         assert result['type'] == 'king_peek_swap'
@@ -252,10 +254,9 @@ class TestBlackKingSelfPeek:
         assert result['swap']['player1'].name != agent.name
         assert result['swap']['player2'].name != agent.name
 
-    def test_self_peek_updates_tracker(self):
+    def test_self_peek_updates_tracker(self, v2_vs_smart):
         """Black King self-peek should record the card in own tracker and known dict."""
-        agent = BayesianV2Agent("V2")
-        opp = SmartAgent("Opp")
+        agent, opp = v2_vs_smart
         game = make_game(agent, opp)
         agent._ensure_initialized(game)
 
@@ -263,7 +264,7 @@ class TestBlackKingSelfPeek:
         assert agent.tracker.own_hand[2] is None
         assert 2 not in agent.known
 
-        card = Card('K', 'Spades')
+        card = KING_OF_SPADES
         result = agent.use_card_power(card, game, peek_player=agent, peek_pos=2, verbose=False)
 
         assert result is True
@@ -271,25 +272,20 @@ class TestBlackKingSelfPeek:
         assert agent.tracker.own_hand[2] is not None
         assert 2 in agent.known
 
-    def test_falls_back_to_opponent_peek_when_all_own_known(self):
+    def test_falls_back_to_opponent_peek_when_all_own_known(self, v2_vs_two_smart):
         """When all own positions are known, should peek opponent instead."""
-        agent = BayesianV2Agent("V2")
-        opp1 = SmartAgent("Opp1")
-        opp2 = SmartAgent("Opp2")
+        agent, opp1, opp2 = v2_vs_two_smart
         game = make_game(agent, opp1, opp2)
         agent._ensure_initialized(game)
 
         # All positions known (good hand)
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Spades'), Card('3', 'Clubs'), Card('A', 'Diamonds')]
-        agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
-        for pos, card in agent.known.items():
-            agent.tracker.set_own_card(pos, (card.rank, card.suit))
+        agent.set_full_known([Card.get('A', 'Hearts'), Card.get('2', 'Spades'), Card.get('3', 'Clubs'), Card.get('A', 'Diamonds')])
 
         # Both opponents have known positions for disruption
         agent.tracker.set_opponent_card('Opp1', 0, ('5', 'Hearts'))
         agent.tracker.set_opponent_card('Opp2', 0, ('4', 'Clubs'))
 
-        card = Card('K', 'Spades')
+        card = KING_OF_SPADES
         result = agent.choose_power_action(card, game, [opp1, opp2])
         assert result is not None
         assert result['type'] == 'king_peek_swap'
@@ -298,60 +294,47 @@ class TestBlackKingSelfPeek:
 
 
 class TestJQDecision:
-    def test_self_swap_when_bad_hand(self):
+    def test_self_swap_when_bad_hand(self, v2_vs_smart):
         """With a bad card, should still do self-swap."""
-        agent = BayesianV2Agent("V2")
-        opp = SmartAgent("Opp")
+        agent, opp = v2_vs_smart
         game = make_game(agent, opp)
         agent._ensure_initialized(game)
 
-        agent.hand = [Card('A', 'Hearts'), Card('K', 'Spades'), Card('3', 'Clubs'), Card('A', 'Diamonds')]
-        agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
-        for pos, card in agent.known.items():
-            agent.tracker.set_own_card(pos, (card.rank, card.suit))
+        agent.set_full_known(list(BLACK_KING_HAND))
 
-        card = Card('J', 'Hearts')
+        card = JACK_OF_HEARTS
         result = agent.choose_power_action(card, game, [opp])
         assert result is not None
         assert result['type'] == 'blind_swap'
         assert result['my_position'] == 1  # K of Spades position
 
-    def test_disruption_swap_when_good_hand(self):
+    def test_disruption_swap_when_good_hand(self, v2_vs_two_smart):
         """With a good hand and 2+ opponents, should do third-party swap."""
-        agent = BayesianV2Agent("V2")
-        opp1 = SmartAgent("Opp1")
-        opp2 = SmartAgent("Opp2")
+        agent, opp1, opp2 = v2_vs_two_smart
         game = make_game(agent, opp1, opp2)
         agent._ensure_initialized(game)
 
         # Give agent all low cards
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Spades'), Card('3', 'Clubs'), Card('A', 'Diamonds')]
-        agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
-        for pos, card in agent.known.items():
-            agent.tracker.set_own_card(pos, (card.rank, card.suit))
+        agent.set_full_known([Card.get('A', 'Hearts'), Card.get('2', 'Spades'), Card.get('3', 'Clubs'), Card.get('A', 'Diamonds')])
 
         # Both opponents have known positions
         agent.tracker.set_opponent_card('Opp1', 0, ('5', 'Hearts'))
         agent.tracker.set_opponent_card('Opp2', 0, ('4', 'Clubs'))
 
-        card = Card('Q', 'Hearts')
+        card = QUEEN_OF_HEARTS
         result = agent.choose_power_action(card, game, [opp1, opp2])
         assert result is not None
         assert result['type'] == 'third_party_swap'
 
-    def test_no_action_when_good_hand_and_single_opponent(self):
+    def test_no_action_when_good_hand_and_single_opponent(self, v2_vs_smart):
         """With a good hand and only 1 opponent, can't do third-party swap."""
-        agent = BayesianV2Agent("V2")
-        opp = SmartAgent("Opp")
+        agent, opp = v2_vs_smart
         game = make_game(agent, opp)
         agent._ensure_initialized(game)
 
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Spades'), Card('3', 'Clubs'), Card('A', 'Diamonds')]
-        agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
-        for pos, card in agent.known.items():
-            agent.tracker.set_own_card(pos, (card.rank, card.suit))
+        agent.set_full_known([Card.get('A', 'Hearts'), Card.get('2', 'Spades'), Card.get('3', 'Clubs'), Card.get('A', 'Diamonds')])
 
-        card = Card('J', 'Hearts')
+        card = JACK_OF_HEARTS
         result = agent.choose_power_action(card, game, [opp])
         # Can't third-party with 1 opponent, hand is too good for self-swap
         assert result is None
@@ -361,6 +344,16 @@ class TestJQDecision:
 # Integration tests
 # ------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def three_player_game():
+    """One V2/Smart/Bayes game for the module; tests reset() it before each deal.
+
+    Seeded, so the sequence of deals (and any failure among them) is the same every run.
+    """
+    return CambioGame([BayesianV2Agent("V2"), SmartAgent("Smart"), BayesianAgent("Bayes")],
+                      rng=random.Random(42))
+
+
 class TestIntegration:
     def test_v2_vs_smart_completes(self):
         """Full game between BayesianV2Agent and SmartAgent completes."""
@@ -391,13 +384,11 @@ class TestIntegration:
         result = game.play(verbose=False, max_turns=100)
         assert 'winner' in result
 
-    def test_many_games_no_crash(self):
+    def test_many_games_no_crash(self, three_player_game):
         """Run many games to catch edge cases."""
+        game = three_player_game
         for _ in range(50):
-            v2 = BayesianV2Agent("V2")
-            opp1 = SmartAgent("Smart")
-            opp2 = BayesianAgent("Bayes")
-            game = CambioGame([v2, opp1, opp2])
+            game.reset()
             game.deal()
             result = game.play(verbose=False, max_turns=100)
             assert 'winner' in result
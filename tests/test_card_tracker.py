@@ -1,10 +1,5 @@
 """Tests for CardTracker."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import pytest
 from game import Card
 from agents.card_tracker import CardTracker, card_to_tuple, tuple_value, full_deck_tuples
@@ -43,11 +38,14 @@ class TestTupleValue:
     def test_joker(self):
         assert tuple_value('Joker', 'None') == 0
 
+    def test_unknown_suit_falls_back_to_rank(self):
+        assert tuple_value('7', 'Stars') == 7
+
 
 class TestCardTrackerInit:
     def test_initialize(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('3', 'Spades')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('3', 'Spades')}
         tracker.initialize(known, 4, ['Opp1', 'Opp2'])
 
         assert tracker.own_hand[0] == ('A', 'Hearts')
@@ -62,7 +60,7 @@ class TestSyncDiscard:
     def test_sync_adds_new_cards(self):
         tracker = CardTracker()
         tracker.initialize({}, 4, ['Opp'])
-        game_discard = [Card('5', 'Hearts'), Card('3', 'Clubs')]
+        game_discard = [Card.get('5', 'Hearts'), Card.get('3', 'Clubs')]
         tracker.sync_discard(game_discard)
         assert len(tracker.discard_pile) == 2
 
@@ -71,31 +69,44 @@ class TestSyncDiscard:
         tracker = CardTracker()
         tracker.initialize({}, 4, ['Opp'])
         # Simulate many cards in discard
-        big_discard = [Card('5', 'Hearts'), Card('3', 'Clubs'), Card('7', 'Diamonds'),
-                       Card('Q', 'Spades'), Card('A', 'Hearts')]
+        big_discard = [Card.get('5', 'Hearts'), Card.get('3', 'Clubs'), Card.get('7', 'Diamonds'),
+                       Card.get('Q', 'Spades'), Card.get('A', 'Hearts')]
         tracker.sync_discard(big_discard)
         assert len(tracker.discard_pile) == 5
 
         # After reshuffle, only the top card remains
-        small_discard = [Card('A', 'Hearts')]
+        small_discard = [Card.get('A', 'Hearts')]
         tracker.sync_discard(small_discard)
         assert len(tracker.discard_pile) == 1
         assert tracker.discard_pile[0] == ('A', 'Hearts')
 
+    def test_sync_same_pile_after_draw_and_discard(self):
+        """Re-syncing the same list picks up a card drawn off the top and new discards."""
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        game_discard = [Card.get('5', 'Hearts'), Card.get('3', 'Clubs')]
+        tracker.sync_discard(game_discard)
+
+        game_discard.pop()
+        game_discard.append(Card.get('K', 'Spades'))
+        game_discard.append(Card.get('9', 'Diamonds'))
+        tracker.sync_discard(game_discard)
+        assert tracker.discard_pile == [('5', 'Hearts'), ('K', 'Spades'), ('9', 'Diamonds')]
+
     def test_unaccounted_correct_after_reshuffle(self):
         """Reshuffle should not corrupt unaccounted card count."""
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('3', 'Spades')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('3', 'Spades')}
         tracker.initialize(known, 4, ['Opp'])
 
         # Add cards to discard
-        discard_cards = [Card('5', 'Hearts'), Card('7', 'Diamonds'), Card('Q', 'Spades')]
+        discard_cards = [Card.get('5', 'Hearts'), Card.get('7', 'Diamonds'), Card.get('Q', 'Spades')]
         tracker.sync_discard(discard_cards)
         # 54 - 2 known - 3 discard = 49 unaccounted
         assert len(tracker.unaccounted_cards()) == 49
 
         # Reshuffle: only top card stays
-        tracker.sync_discard([Card('Q', 'Spades')])
+        tracker.sync_discard([Card.get('Q', 'Spades')])
         # 54 - 2 known - 1 discard = 51 unaccounted
         assert len(tracker.unaccounted_cards()) == 51
 
@@ -103,7 +114,7 @@ class TestSyncDiscard:
 class TestUnaccountedCards:
     def test_starts_with_54_minus_known(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('3', 'Spades')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('3', 'Spades')}
         tracker.initialize(known, 4, ['Opp'])
         remaining = tracker.unaccounted_cards()
         # 54 total - 2 known own cards = 52 unaccounted
@@ -125,6 +136,38 @@ class TestUnaccountedCards:
         after_count = len(tracker.unaccounted_cards())
         assert after_count == initial_count - 1
 
+    def test_set_own_cards_from_hand_order(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.set_own_cards([Card.get('A', 'Hearts'), Card.get('7', 'Diamonds')])
+        assert tracker.own_hand == {0: ('A', 'Hearts'), 1: ('7', 'Diamonds'), 2: None, 3: None}
+        assert len(tracker.unaccounted_cards()) == 52
+
+    def test_set_opponent_cards_from_hand_order(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.set_opponent_cards('Opp', [('Q', 'Clubs'), ('2', 'Hearts')])
+        assert tracker.opponent_hands['Opp'] == {0: ('Q', 'Clubs'), 1: ('2', 'Hearts'), 2: None, 3: None}
+        assert len(tracker.unaccounted_cards()) == 52
+
+    def test_set_own_and_opponent_cards_from_mappings(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.set_own_cards({1: Card.get('7', 'Diamonds'), 3: ('A', 'Hearts')})
+        tracker.set_opponent_cards('Opp', {2: Card.get('Q', 'Clubs')})
+        tracker.set_own_cards({1: Card.get('7', 'Diamonds')})
+        assert tracker.own_hand == {0: None, 1: ('7', 'Diamonds'), 2: None, 3: ('A', 'Hearts')}
+        assert tracker.opponent_hands['Opp'][2] == ('Q', 'Clubs')
+        assert len(tracker.unaccounted_cards()) == 51
+
+    def test_set_card_accepts_card_objects(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.set_own_card(2, Card.get('7', 'Diamonds'))
+        tracker.set_opponent_card('Opp', 1, Card.get('Q', 'Clubs'))
+        assert tracker.own_hand[2] == ('7', 'Diamonds')
+        assert tracker.opponent_hands['Opp'][1] == ('Q', 'Clubs')
+
     def test_setting_opponent_card_reduces_unaccounted(self):
         tracker = CardTracker()
         tracker.initialize({}, 4, ['Opp'])
@@ -133,6 +176,38 @@ class TestUnaccountedCards:
         after_count = len(tracker.unaccounted_cards())
         assert after_count == initial_count - 1
 
+    def test_overwritten_and_forgotten_cards_return_to_pool(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.set_own_card(0, ('7', 'Diamonds'))
+        tracker.set_own_card(0, ('K', 'Spades'))
+        tracker.set_opponent_card('Opp', 3, ('7', 'Diamonds'))
+        tracker.own_card_swapped_out(0)
+        tracker.update_opponent_hand_size('Opp', 3)
+        assert len(tracker.unaccounted_cards()) == 54
+        assert tracker.expected_value_of_unknown() == pytest.approx(sum(
+            tuple_value(*c) for c in full_deck_tuples()) / 54)
+
+    def test_reset_restores_full_deck(self):
+        tracker = CardTracker()
+        tracker.initialize({0: Card.get('A', 'Hearts')}, 4, ['Opp'])
+        tracker.set_opponent_card('Opp', 0, ('Q', 'Clubs'))
+        tracker.sync_discard([Card.get('5', 'Hearts')])
+        own_hand = tracker.own_hand
+        tracker.reset()
+        assert tracker.own_hand is own_hand and own_hand == {}
+        assert tracker.opponent_hands == {} and tracker.discard_pile == []
+        assert len(tracker.unaccounted_cards()) == 54
+
+    def test_card_seen_twice_counts_once(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.card_to_discard(('5', 'Hearts'))
+        tracker.set_own_card(1, ('5', 'Hearts'))
+        assert len(tracker.unaccounted_cards()) == 53
+        tracker.own_card_swapped_out(1)
+        assert len(tracker.unaccounted_cards()) == 53
+
 
 class TestExpectedValues:
     def test_expected_value_changes_as_cards_accounted(self):
@@ -150,7 +225,7 @@ class TestExpectedValues:
 
     def test_expected_value_at_known_position(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts')}
+        known = {0: Card.get('A', 'Hearts')}
         tracker.initialize(known, 4, ['Opp'])
         assert tracker.expected_value_at_position(0) == 1
 
@@ -162,7 +237,7 @@ class TestExpectedValues:
 
     def test_expected_own_score_mixes_known_and_unknown(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('2', 'Spades')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('2', 'Spades')}
         tracker.initialize(known, 4, ['Opp'])
         score = tracker.expected_own_score()
         e_unknown = tracker.expected_value_of_unknown()
@@ -178,18 +253,37 @@ class TestExpectedValues:
         expected = 10 + 3 * e_unknown
         assert abs(score - expected) < 0.01
 
+    def test_precomputed_e_unknown_is_used(self):
+        tracker = CardTracker()
+        known = {0: Card.get('A', 'Hearts')}
+        tracker.initialize(known, 4, ['Opp'])
+        assert tracker.expected_value_at_position(0, e_unknown=2.0) == 1
+        assert tracker.expected_value_at_position(1, e_unknown=2.0) == 2.0
+        assert tracker.expected_own_score(e_unknown=2.0) == 1 + 3 * 2.0
+        assert tracker.expected_opponent_score('Opp', e_unknown=2.0) == 4 * 2.0
+
+    def test_unknown_suit_valued_by_rank(self):
+        tracker = CardTracker()
+        tracker.initialize({}, 4, ['Opp'])
+        tracker.set_own_card(0, ('7', 'Stars'))
+        tracker.set_opponent_card('Opp', 0, ('9', 'Stars'))
+        assert tracker.expected_value_at_position(0) == 7
+        assert tracker.expected_own_score(e_unknown=2.0) == 7 + 3 * 2.0
+        assert tracker.expected_opponent_score('Opp', e_unknown=2.0) == 9 + 3 * 2.0
+        assert tracker.worst_own_position() == (0, 7)
+
 
 class TestPositionTracking:
     def test_own_unknown_positions(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts')}
+        known = {0: Card.get('A', 'Hearts')}
         tracker.initialize(known, 4, ['Opp'])
         unknowns = tracker.own_unknown_positions()
         assert unknowns == [1, 2, 3]
 
     def test_own_card_swapped_out(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('3', 'Spades')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('3', 'Spades')}
         tracker.initialize(known, 4, ['Opp'])
         tracker.own_card_swapped_out(0)
         assert tracker.own_hand[0] is None
@@ -197,7 +291,7 @@ class TestPositionTracking:
 
     def test_worst_own_position(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('10', 'Spades'), 2: Card('3', 'Clubs')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('10', 'Spades'), 2: Card.get('3', 'Clubs')}
         tracker.initialize(known, 4, ['Opp'])
         pos, val = tracker.worst_own_position()
         assert pos == 1
@@ -205,7 +299,7 @@ class TestPositionTracking:
 
     def test_remove_own_position_shifts(self):
         tracker = CardTracker()
-        known = {0: Card('A', 'Hearts'), 1: Card('3', 'Spades'), 2: Card('5', 'Clubs'), 3: Card('7', 'Diamonds')}
+        known = {0: Card.get('A', 'Hearts'), 1: Card.get('3', 'Spades'), 2: Card.get('5', 'Clubs'), 3: Card.get('7', 'Diamonds')}
         tracker.initialize(known, 4, ['Opp'])
         tracker.remove_own_position(1)
         assert len(tracker.own_hand) == 3
@@ -227,5 +321,19 @@ class TestPositionTracking:
         assert tracker.opponent_hands['Opp'][2] == ('7', 'Diamonds')
 
 
+class TestOpponentSelfKnowledge:
+    def test_mask_tracks_gains_and_losses(self):
+        tracker = CardTracker()
+        tracker.init_opponent_self_knowledge('Opp')
+        tracker.opponent_gains_knowledge('Opp', 3)
+        tracker.opponent_loses_knowledge('Opp', 0)
+        assert tracker.opponent_knowledge_mask('Opp') == 0b1010
+        assert tracker.get_opponent_self_knowledge('Opp') == {1, 3}
+
+    def test_unknown_opponent_knows_nothing(self):
+        tracker = CardTracker()
+        assert tracker.opponent_knowledge_mask('Opp') == 0
+        assert tracker.get_opponent_self_knowledge('Opp') == set()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
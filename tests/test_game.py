@@ -0,0 +1,46 @@
+"""Tests for CambioGame scoring and seating."""
+
+import random
+
+import pytest
+from game import Card, CambioGame, Player
+
+
+def make_finished_game(*hands):
+    """A game whose players hold *hands* as their final cards; nothing is dealt."""
+    players = [Player(f"P{i + 1}") for i in range(len(hands))]
+    for player, hand in zip(players, hands):
+        player.hand = [Card.get(rank, suit) for rank, suit in hand]
+    return CambioGame(players)
+
+
+SCORING_CASES = [
+    # (final hands, expected scores, expected winner)
+    pytest.param([[('A', 'Hearts'), ('2', 'Hearts')], [('K', 'Hearts'), ('K', 'Diamonds')]],
+                 [3, -2], 'P2', id='red_kings_score_minus_one'),
+    pytest.param([[('K', 'Spades'), ('Q', 'Clubs')], [('J', 'Hearts'), ('10', 'Diamonds')]],
+                 [20, 20], 'P1', id='tie_goes_to_first_seat'),
+    pytest.param([[('Joker', 'None')], [('A', 'Spades')], [('5', 'Clubs'), ('9', 'Hearts')]],
+                 [0, 1, 14], 'P1', id='joker_scores_zero'),
+    pytest.param([[], [('3', 'Clubs')]], [0, 3], 'P1', id='empty_hand_scores_zero'),
+]
+
+
+@pytest.mark.parametrize("hands, scores, winner", SCORING_CASES)
+def test_scoring(hands, scores, winner):
+    game = make_finished_game(*hands)
+    assert [game.calculate_score(p) for p in game.players] == scores
+    assert game.score_game() == f'"{winner}" wins with a score of {min(scores)}!'
+
+
+def test_unseeded_game_reseats_players_from_a_seeded_one():
+    players = [Player("P1"), Player("P2")]
+    seeded = random.Random(1)
+    CambioGame(players, rng=seeded)
+    assert all(p.rng is seeded for p in players)
+    CambioGame(players)
+    assert all(p.rng is random for p in players)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,10 +1,6 @@
 """Tests for SmartAgent."""
 
 from random import random
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
 from agents.smart_agent import SmartAgent
@@ -26,34 +22,34 @@ class TestCallCambio:
 
     def test_calls_cambio_with_confidence(self):
         agent = SmartAgent()
-        agent.hand = [Card('A', 'Hearts'), Card('A', 'Spades'), Card('A', 'Diamonds'), Card('A', 'Clubs')]
+        agent.hand = [Card.get('A', 'Hearts'), Card.get('A', 'Spades'), Card.get('A', 'Diamonds'), Card.get('A', 'Clubs')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
         opponent = SmartAgent("Opponent")
-        opponent.hand = [Card('5', 'Hearts'), Card('6', 'Spades'), Card('7', 'Diamonds'), Card('8', 'Clubs')]
+        opponent.hand = [Card.get('5', 'Hearts'), Card.get('6', 'Spades'), Card.get('7', 'Diamonds'), Card.get('8', 'Clubs')]
         agent.opponent_known = {opponent: {0: opponent.hand[0], 1: opponent.hand[1], 2: opponent.hand[2], 3: opponent.hand[3]}}
         assert agent.call_cambio() is True
 
 class TestSmartAgentPowerActions:
     def test_power_action_no_card(self):
         agent = SmartAgent()
-        agent.hand = [Card('A', 'Hearts')]
+        agent.hand = [Card.get('A', 'Hearts')]
         result = agent.choose_power_action(agent.hand[0], None, [])
         assert result is None
 
     def test_power_action_peak_own(self):
         agent = SmartAgent()
-        agent.hand = [Card('7', 'Hearts'), Card('8', 'Spades'), Card('9', 'Diamonds'), Card('10', 'Clubs')]
+        agent.hand = [Card.get('7', 'Hearts'), Card.get('8', 'Spades'), Card.get('9', 'Diamonds'), Card.get('10', 'Clubs')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}
         result = agent.choose_power_action(agent.hand[0], None, [])
         assert result == {'type': 'peek_own', 'position': 2}
 
     def test_power_action_peek_opponent(self):
         agent = SmartAgent()
-        agent.hand = [Card('A', 'Hearts'), Card('2', 'Spades'), Card('9', 'Diamonds'), Card('10', 'Clubs')]
+        agent.hand = [Card.get('A', 'Hearts'), Card.get('2', 'Spades'), Card.get('9', 'Diamonds'), Card.get('10', 'Clubs')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1]}
 
         opponent = SmartAgent("Opponent")
-        opponent.hand = [Card('5', 'Hearts')]
+        opponent.hand = [Card.get('5', 'Hearts')]
         opponent.known = {0: opponent.hand[0]}
         opponents = [opponent]
         result = agent.choose_power_action(agent.hand[2], None, opponents)
@@ -63,11 +59,11 @@ class TestSmartAgentPowerActions:
 
     def test_power_action_blind_swap(self):
         agent = SmartAgent()
-        agent.hand = [Card('5', 'Hearts'), Card('6', 'Spades'), Card('J', 'Diamonds'), Card('Q', 'Clubs')]
+        agent.hand = [Card.get('5', 'Hearts'), Card.get('6', 'Spades'), Card.get('J', 'Diamonds'), Card.get('Q', 'Clubs')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
         
         opponent = SmartAgent("Opponent")
-        opponent.hand = [Card('5', 'Hearts')]
+        opponent.hand = [Card.get('5', 'Hearts')]
         opponent.known = {0: opponent.hand[0]}
         opponents = [opponent]
         result = agent.choose_power_action(agent.hand[2], None, opponents)
@@ -78,14 +74,14 @@ class TestSmartAgentPowerActions:
 
     def test_power_action_king_swap(self):
         agent = SmartAgent()
-        agent.hand = [Card('K', 'Spades'), Card('6', 'Clubs'), Card('3', 'Hearts'), Card('4', 'Hearts')]
+        agent.hand = [Card.get('K', 'Spades'), Card.get('6', 'Clubs'), Card.get('3', 'Hearts'), Card.get('4', 'Hearts')]
         agent.known = {0: agent.hand[0], 1: agent.hand[1], 2: agent.hand[2], 3: agent.hand[3]}
         
         opp_A = SmartAgent("Opponent_A")
-        opp_A.hand = [Card('A', 'Hearts')]
+        opp_A.hand = [Card.get('A', 'Hearts')]
         opp_A.known = {0: opp_A.hand[0]}
         opp_B = SmartAgent("Opponent_B")
-        opp_B.hand = [Card('10', 'Clubs')]
+        opp_B.hand = [Card.get('10', 'Clubs')]
         opp_B.known = {0: opp_B.hand[0]}
         opponents = [opp_A, opp_B]
         result = agent.choose_power_action(agent.hand[0], None, opponents)